@@ -20,35 +20,72 @@ Use scripts/autonomous.sh to invoke Claude in autonomous mode.
 Interactive sessions are never interrupted.
 """
 
+import io
 import json
+import os
 import sys
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 # ---------------------------------------------------------------------------
 # Locate vault relative to this hook's location
 # ---------------------------------------------------------------------------
-# .claude/hooks/ralph_wiggum.py → project root is two dirs up
-_PROJECT_DIR   = Path(__file__).resolve().parent.parent.parent
-_VAULT         = _PROJECT_DIR / "vault"
-_AUTONOMOUS_FLAG = Path(__file__).resolve().parent / ".autonomous_mode"
+# .claude/hooks/ralph_wiggum.py → project root is two dirs up.
+# Plain os.path strings: this script cold-starts on every Claude stop, so
+# pathlib's import and per-call resolution overhead isn't worth paying.
+_HERE          = os.path.dirname(os.path.realpath(__file__))
+_VAULT         = os.path.normpath(os.path.join(_HERE, "..", "..", "vault"))
+_AUTONOMOUS_FLAG = os.path.join(_HERE, ".autonomous_mode")
 
 
-def _count_md(folder: Path) -> list[str]:
-    """Return list of .md file names, excluding .gitkeep placeholder."""
-    if not folder.exists():
+def _count_md(folder: str) -> list[str]:
+    """Return list of .md file names, excluding .gitkeep placeholder.
+
+    Uses os.scandir directly — no Path objects or per-entry stat calls, since
+    this hook runs on every Claude stop.
+    """
+    try:
+        with os.scandir(folder) as it:
+            return [e.name for e in it if e.name.endswith(".md") and e.name != ".gitkeep"]
+    except FileNotFoundError:
         return []
-    return [f.name for f in folder.glob("*.md") if f.name != ".gitkeep"]
+
+
+def _has_md(folder: str) -> bool:
+    """Return True as soon as one .md file is seen — no full directory listing."""
+    try:
+        with os.scandir(folder) as it:
+            return next((True for e in it if e.name.endswith(".md") and e.name != ".gitkeep"), False)
+    except FileNotFoundError:
+        return False
+
+
+_SCAN_FOLDERS = ("Needs_Action", "Approved", "Rejected")
+
+
+def _scan_vault(vault: str, folders: tuple[str, ...] = _SCAN_FOLDERS) -> dict[str, list[str]]:
+    """Scan the given vault folders concurrently so readdir latency overlaps.
+
+    Folders not listed map to an empty list.
+    """
+    result: dict[str, list[str]] = {name: [] for name in _SCAN_FOLDERS}
+    if not folders:
+        return result
+    with ThreadPoolExecutor(max_workers=len(folders)) as pool:
+        futures = {name: pool.submit(_count_md, os.path.join(vault, name)) for name in folders}
+        result.update({name: fut.result() for name, fut in futures.items()})
+    return result
 
 
 def main() -> None:
     # ── Only fire in autonomous mode ──────────────────────────────────────
-    if not _AUTONOMOUS_FLAG.exists():
+    if not os.path.exists(_AUTONOMOUS_FLAG):
         sys.stderr.write("Ralph Wiggum: idle (not in autonomous mode)\n")
         sys.exit(0)
 
-    needs_action = _count_md(_VAULT / "Needs_Action")
-    approved     = _count_md(_VAULT / "Approved")
-    rejected     = _count_md(_VAULT / "Rejected")
+    # Cheap "any?" probes decide the exit code; full listings are only
+    # needed when there is work to describe.
+    has_needs_action = _has_md(os.path.join(_VAULT, "Needs_Action"))
+    has_approved     = _has_md(os.path.join(_VAULT, "Approved"))
 
     # ── Read stdin (Claude Code passes session info as JSON) ──────────────
     try:
@@ -58,21 +95,35 @@ def main() -> None:
         session = {}
 
     # ── Nothing to do — remove flag and let Claude stop ──────────────────
-    if not needs_action and not approved:
-        _AUTONOMOUS_FLAG.unlink(missing_ok=True)
+    if not has_needs_action and not has_approved:
+        try:
+            os.remove(_AUTONOMOUS_FLAG)
+        except FileNotFoundError:
+            pass
         sys.exit(0)
 
+    scan = _scan_vault(_VAULT, tuple(
+        name for name, wanted in (
+            ("Needs_Action", has_needs_action),
+            ("Approved",     has_approved),
+            ("Rejected",     True),
+        ) if wanted
+    ))
+    needs_action = scan["Needs_Action"]
+    approved     = scan["Approved"]
+    rejected     = scan["Rejected"]
+
     # ── Build re-injection message ─────────────────────────────────────────
-    parts: list[str] = ["⟳ **Ralph Wiggum Loop** — pending work detected, continuing.\n"]
+    buf = io.StringIO()
+    buf.write("⟳ **Ralph Wiggum Loop** — pending work detected, continuing.\n")
 
     if needs_action:
-        parts.append(
-            f"**{len(needs_action)} item(s) in vault/Needs_Action/** waiting to be processed:\n"
-            + "\n".join(f"  - `{name}`" for name in needs_action[:5])
-            + ("\n  - _(and more...)_" if len(needs_action) > 5 else "")
-        )
-        parts.append(
-            "\nPlease run the vault-operator skill to process these items:\n"
+        buf.write(f"\n**{len(needs_action)} item(s) in vault/Needs_Action/** waiting to be processed:")
+        buf.writelines(f"\n  - `{name}`" for name in needs_action[:5])
+        if len(needs_action) > 5:
+            buf.write("\n  - _(and more...)_")
+        buf.write(
+            "\n\nPlease run the vault-operator skill to process these items:\n"
             "1. Read `vault/Company_Handbook.md` for rules\n"
             "2. Process each item in `vault/Needs_Action/`\n"
             "3. Create Plans and Approval requests as needed\n"
@@ -80,26 +131,24 @@ def main() -> None:
         )
 
     if approved:
-        parts.append(
-            f"\n**{len(approved)} approved action(s) in vault/Approved/** waiting to execute:\n"
-            + "\n".join(f"  - `{name}`" for name in approved[:5])
-        )
-        parts.append(
-            "\nPlease run the approval-executor skill to dispatch these:\n"
+        buf.write(f"\n\n**{len(approved)} approved action(s) in vault/Approved/** waiting to execute:")
+        buf.writelines(f"\n  - `{name}`" for name in approved[:5])
+        buf.write(
+            "\n\nPlease run the approval-executor skill to dispatch these:\n"
             "```bash\n"
             "python .claude/skills/approval-executor/scripts/execute.py --vault ./vault\n"
             "```"
         )
 
     if rejected:
-        parts.append(
-            f"\n📋 **{len(rejected)} rejected item(s) in vault/Rejected/** — no action required, "
-            "but consider moving to Done/ to keep the vault clean:\n"
-            + "\n".join(f"  - `{name}`" for name in rejected[:5])
+        buf.write(
+            f"\n\n📋 **{len(rejected)} rejected item(s) in vault/Rejected/** — no action required, "
+            "but consider moving to Done/ to keep the vault clean:"
         )
+        buf.writelines(f"\n  - `{name}`" for name in rejected[:5])
 
-    message = "\n".join(parts)
-    print(message)
+    buf.write("\n")
+    sys.stdout.write(buf.getvalue())
     sys.exit(2)  # block stop, re-inject message as new user turn
 
 
@@ -16,9 +16,12 @@ Usage:
 """
 
 import argparse
+import atexit
+import contextvars
 import json
 import logging
 import os
+import queue
 import re
 import subprocess
 import sys
@@ -29,11 +32,6 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 
-try:
-    import yaml
-except ImportError:
-    sys.exit("Missing dependency: pyyaml\nRun: pip install pyyaml")
-
 _SCRIPT_DIR  = Path(__file__).resolve().parent
 _PROJECT_DIR = _SCRIPT_DIR.parent.parent.parent.parent  # project root
 
@@ -183,7 +181,7 @@ def _rate_limit_check() -> bool:
     Thread-safe via _rate_lock.
     """
     with _rate_lock:
-        bucket = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H")
+        bucket = _now().strftime("%Y-%m-%dT%H")
         if _rate_state["bucket"] != bucket:
             _rate_state["bucket"] = bucket
             _rate_state["count"] = 0
@@ -236,19 +234,32 @@ def _write_metrics(vault: Path) -> None:
 
 
 def _record_metric(key: str, vault: Path) -> None:
+    # Write under the lock too — concurrent writers share metrics.tmp
     with _metrics_lock:
         _metrics["actions_total"] += 1
         if key in _metrics:
             _metrics[key] += 1
-    _write_metrics(vault)
+        _write_metrics(vault)
+
+
+# Per-approval clock: execute_approval() takes one reading before dispatch and
+# one after, and every timestamp in between (audit, rate bucket, expiry,
+# alerts) reuses it instead of querying the clock again.
+_cached_now: contextvars.ContextVar[datetime | None] = contextvars.ContextVar(
+    "cached_now", default=None
+)
+
+
+def _now() -> datetime:
+    return _cached_now.get() or datetime.now(timezone.utc)
 
 
 def _ts() -> str:
-    return datetime.now(timezone.utc).isoformat()
+    return _now().isoformat()
 
 
 def _today() -> str:
-    return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    return _now().strftime("%Y-%m-%d")
 
 
 # ---------------------------------------------------------------------------
@@ -258,26 +269,115 @@ def _today() -> str:
 _FM_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n?(.*)", re.DOTALL)
 
 
+_YAML_ONLY_STARTS = ("{", "[", "|", ">", "&", "*", "!", "#", "%", "@", "`")
+_YAML_NULLS = {"", "~", "null", "Null", "NULL"}
+
+
+def _yaml_frontmatter(fm_text: str) -> dict:
+    """Full YAML parse for frontmatter the flat parser can't handle.
+
+    pyyaml is optional here, but without it this raises ValueError rather than
+    returning a partial parse — a dropped or mangled action/status/expires_at
+    must not reach the execution gate.
+    """
+    try:
+        import yaml
+    except ImportError:
+        raise ValueError(
+            "frontmatter needs a full YAML parser — run: pip install pyyaml"
+        ) from None
+    try:
+        data = yaml.safe_load(fm_text)
+    except yaml.YAMLError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _quoted_needs_yaml(value: str) -> bool:
+    """True for a quoted value that simple quote-stripping would get wrong."""
+    if not value or value[0] not in "'\"":
+        return False
+    q = value[0]
+    return (
+        len(value) < 2 or value[-1] != q
+        or q in value[1:-1]                 # '' escapes or a trailing comment
+        or (q == '"' and "\\" in value)     # backslash escapes
+    )
+
+
+def _parse_frontmatter(fm_text: str) -> dict:
+    """Parse approval frontmatter — a flat map of 'key: value' scalars.
+
+    Values are kept as strings (callers str() them anyway). Anything the flat
+    reading could get wrong — indented lines, list items, flow collections,
+    block scalars, inline comments, nulls, escaped double-quoted strings —
+    sends the whole block to YAML instead.
+    """
+    fm: dict = {}
+    for line in fm_text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        key, sep, value = line.partition(":")
+        key, value = key.strip(), value.strip()
+        if (
+            line[0] in " \t-" or not sep or not key
+            or value.startswith(_YAML_ONLY_STARTS) or value in _YAML_NULLS
+            or " #" in value or "\t#" in value
+            or key[0] in "'\"" or _quoted_needs_yaml(value)
+        ):
+            return _yaml_frontmatter(fm_text)
+        if value[0] in "'\"":
+            value = value[1:-1]
+        fm[key] = value
+    return fm
+
+
 def _parse_approval(text: str) -> tuple[dict, str]:
     m = _FM_RE.match(text)
     if m:
-        try:
-            fm = yaml.safe_load(m.group(1)) or {}
-        except yaml.YAMLError:
-            fm = {}
-        return fm, m.group(2).strip()
+        return _parse_frontmatter(m.group(1)), m.group(2).strip()
     return {}, text.strip()
 
 
+def _field_re(label: str) -> re.Pattern:
+    return re.compile(rf"\*\*{re.escape(label)}:?\*\*[:\s]+(.+)")
+
+
+# Labels read by _build_args on every approval — compiled once at import.
+_FIELD_RES: dict[str, re.Pattern] = {
+    label: _field_re(label)
+    for label in ("Target", "Subject / Title", "Subject", "Email")
+}
+
+_MSG_RE = re.compile(r"##\s+Message[^#\n]*\n+(.*?)(?:\n##|$)", re.DOTALL)
+
+
+_STATUS_RE = re.compile(r"^status:\s*.+$", re.MULTILINE)
+
+
+def _set_status(text: str, new_status: str) -> str:
+    """Rewrite the frontmatter 'status:' line without scanning the message body."""
+    if text.startswith("---"):
+        fm_end = text.find("\n---", 3)
+        if fm_end != -1:
+            head = _STATUS_RE.sub(f"status: {new_status}", text[:fm_end], count=1)
+            return head + text[fm_end:]
+    return _STATUS_RE.sub(f"status: {new_status}", text)
+
+
 def _extract_field(body: str, label: str) -> str:
     """Extract value from '- **Label:** value' lines in body."""
-    m = re.search(rf"\*\*{re.escape(label)}:?\*\*[:\s]+(.+)", body)
+    pattern = _FIELD_RES.get(label)
+    if pattern is None:
+        pattern = _FIELD_RES[label] = _field_re(label)
+    m = pattern.search(body)
     return m.group(1).strip() if m else ""
 
 
 def _extract_message(body: str) -> str:
     """Extract content under '## Message / Content' section, stripping 2-space indent."""
-    m = re.search(r"##\s+Message[^#\n]*\n+(.*?)(?:\n##|$)", body, re.DOTALL)
+    m = _MSG_RE.search(body)
     if not m:
         return ""
     raw = m.group(1)
@@ -302,6 +402,13 @@ _ACTION_SCRIPTS: dict[str, Path] = {
     "odoo_log_activity":             _SKILLS_DIR / "odoo-crm"          / "scripts" / "odoo_client.py",
 }
 
+# Existence is checked once at import; a script that appears later needs a
+# restart. Dispatch only looks up this table — no per-approval stat().
+_ACTION_SCRIPTS_RESOLVED: dict[str, Path] = {
+    action: script for action, script in _ACTION_SCRIPTS.items() if script.exists()
+}
+_PYTHON = sys.executable
+
 
 # ---------------------------------------------------------------------------
 # Per-action argument builders
@@ -390,12 +497,71 @@ def _build_args(action: str, body: str) -> list[str] | None:
 # Audit log
 # ---------------------------------------------------------------------------
 
+# Entries are handed to a background writer thread so dispatch never blocks
+# on log I/O. The writer drains everything queued and appends it with one
+# open per log file. _flush_audit() is a barrier — it returns once all
+# entries queued before it are on disk — called after each batch and at exit.
+_AUDIT_Q: queue.SimpleQueue = queue.SimpleQueue()
+_audit_writer: threading.Thread | None = None
+_audit_writer_lock = threading.Lock()
+
+
+def _write_audit_lines(pending: list[tuple[Path, str]]) -> None:
+    by_file: dict[Path, list[str]] = {}
+    for log_file, line in pending:
+        by_file.setdefault(log_file, []).append(line)
+    for log_file, lines in by_file.items():
+        try:
+            log_file.parent.mkdir(parents=True, exist_ok=True)
+            with log_file.open("a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+        except OSError as exc:
+            _log.error(f"Could not write audit log {log_file}: {exc}")
+
+
+def _audit_writer_loop() -> None:
+    while True:
+        batch = [_AUDIT_Q.get()]
+        while True:
+            try:
+                batch.append(_AUDIT_Q.get_nowait())
+            except queue.Empty:
+                break
+        barriers = [item for item in batch if isinstance(item, threading.Event)]
+        _write_audit_lines([item for item in batch if not isinstance(item, threading.Event)])
+        for barrier in barriers:
+            barrier.set()
+
+
+def _ensure_audit_writer() -> None:
+    global _audit_writer
+    if _audit_writer is not None:
+        return
+    with _audit_writer_lock:
+        if _audit_writer is None:
+            _audit_writer = threading.Thread(
+                target=_audit_writer_loop, name="audit-writer", daemon=True
+            )
+            _audit_writer.start()
+
+
 def _audit(vault: Path, event: str, **kwargs) -> None:
     entry = {"timestamp": _ts(), "event": event, **kwargs}
     log_file = vault / "Logs" / f"{_today()}.jsonl"
-    log_file.parent.mkdir(parents=True, exist_ok=True)
-    with log_file.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(entry, default=str) + "\n")
+    _ensure_audit_writer()
+    _AUDIT_Q.put((log_file, json.dumps(entry, default=str)))
+
+
+def _flush_audit(timeout: float = 5.0) -> None:
+    """Block until every audit entry queued so far has been written."""
+    if _audit_writer is None:
+        return
+    barrier = threading.Event()
+    _AUDIT_Q.put(barrier)
+    barrier.wait(timeout)
+
+
+atexit.register(_flush_audit)
 
 
 # ---------------------------------------------------------------------------
@@ -405,7 +571,7 @@ def _audit(vault: Path, event: str, **kwargs) -> None:
 def _alert_failure(vault: Path, filename: str, action: str, error: str) -> None:
     """Write a CRITICAL alert to vault/Needs_Action/ when an action fails."""
     try:
-        now = datetime.now(timezone.utc)
+        now = _now()
         alert_name = f"CRITICAL_FAILED_{action.upper()}_{now.strftime('%Y%m%d_%H%M%S')}.md"
         content = f"""\
 ---
@@ -440,20 +606,89 @@ An approved action failed to execute and requires attention.
         _log.error(f"Could not write failure alert: {exc}")
 
 
+def _relocate(approval_file: Path, dest_dir: Path, updated_text: str) -> Path:
+    """Stamp the new status into the approval, then move it into dest_dir.
+
+    The status is written in place first, not straight to dest_dir: a crash
+    before the move then leaves a file that already says sent/failed/timeout
+    and is skipped next run, where a write-at-destination would leave the
+    untouched original in Approved/ to be executed again. The move is the
+    same as planning_engine._move_no_clobber: hard-link into dest_dir, which
+    never overwrites (a taken name gets a timestamped sibling), then unlink
+    the source; filesystems without hard links fall back to exists() + rename().
+    """
+    approval_file.write_text(updated_text, encoding="utf-8")
+    dest = dest_dir / approval_file.name
+    try:
+        os.link(approval_file, dest)
+    except FileExistsError:
+        dest = dest.with_name(f"{dest.stem}_{time.time_ns()}{dest.suffix}")
+    except OSError:
+        if dest.exists():
+            dest = dest.with_name(f"{dest.stem}_{time.time_ns()}{dest.suffix}")
+    else:
+        try:
+            approval_file.unlink()
+        except OSError:
+            dest.unlink(missing_ok=True)  # never leave it in both folders
+            raise
+        return dest
+    approval_file.rename(dest)
+    return dest
+
+
+def _relocate_or_report(
+    vault: Path, approval_file: Path, dest_dir: Path, updated_text: str,
+    action: str, trace_id: str,
+) -> Path | None:
+    """_relocate(), but a failed move is audited as move_error, not raised.
+
+    By this point the skill has already run; the action must not be reported
+    as an action_error just because the file could not be archived.
+    """
+    try:
+        return _relocate(approval_file, dest_dir, updated_text)
+    except OSError as exc:
+        _log.error(f"Could not move {approval_file.name} to {dest_dir.name}/: {exc}")
+        _audit(vault, "move_error", action=action, file=approval_file.name,
+               destination=dest_dir.name, error=str(exc),
+               **( {"trace_id": trace_id} if trace_id else {} ))
+        return None
+
+
 def execute_approval(
     approval_file: Path,
     vault: Path,
     dry_run: bool = False,
     failed_dir: Path | None = None,
 ) -> dict:
+    token = _cached_now.set(datetime.now(timezone.utc))
+    try:
+        return _execute_approval(approval_file, vault, dry_run, failed_dir)
+    finally:
+        _cached_now.reset(token)
+
+
+def _execute_approval(
+    approval_file: Path,
+    vault: Path,
+    dry_run: bool,
+    failed_dir: Path | None,
+) -> dict:
+    # Read in the worker, not up front: an approval withdrawn (moved to
+    # Rejected/ or deleted) while queued behind the pool raises here instead
+    # of being sent from a stale copy.
     text = approval_file.read_text(encoding="utf-8")
-    fm, body = _parse_approval(text)
+    try:
+        fm, body = _parse_approval(text)
+    except ValueError as exc:
+        return {"status": "error", "reason": f"Cannot parse frontmatter: {exc}", "file": approval_file.name}
 
     action = str(fm.get("action", "")).lower()
     status = str(fm.get("status", "")).lower()
     trace_id = str(fm.get("trace_id", ""))
 
-    if status in ("sent", "posted", "failed"):
+    if status in ("sent", "posted", "failed", "timeout"):
         _record_metric("actions_skipped", vault)
         return {"status": "skipped", "reason": f"Already processed: status={status}", "file": approval_file.name}
 
@@ -464,7 +699,7 @@ def execute_approval(
             exp_dt = datetime.fromisoformat(str(expires_at_raw))
             if exp_dt.tzinfo is None:
                 exp_dt = exp_dt.replace(tzinfo=timezone.utc)
-            if datetime.now(timezone.utc) > exp_dt:
+            if _now() > exp_dt:
                 print(f"  ⚠ Expired at {expires_at_raw} — skipping. Move to Rejected/ to clean up.")
                 return {"status": "skipped", "reason": f"Approval expired at {expires_at_raw}", "file": approval_file.name}
         except ValueError:
@@ -473,12 +708,13 @@ def execute_approval(
     if not action:
         return {"status": "error", "reason": "No 'action' field in frontmatter.", "file": approval_file.name}
 
-    script = _ACTION_SCRIPTS.get(action)
+    script = _ACTION_SCRIPTS_RESOLVED.get(action)
     if not script:
-        return {"status": "error", "reason": f"Unknown action type: '{action}'", "file": approval_file.name}
-
-    if not script.exists():
-        return {"status": "error", "reason": f"Skill script not found: {script}", "file": approval_file.name}
+        if action in _ACTION_SCRIPTS:
+            reason = f"Skill script not found: {_ACTION_SCRIPTS[action]}"
+        else:
+            reason = f"Unknown action type: '{action}'"
+        return {"status": "error", "reason": reason, "file": approval_file.name}
 
     try:
         extra_args = _build_args(action, body)
@@ -487,7 +723,7 @@ def execute_approval(
     if extra_args is None:
         return {"status": "error", "reason": "Could not extract required fields (target/message) from approval file.", "file": approval_file.name}
 
-    cmd = [sys.executable, str(script)] + extra_args
+    cmd = [_PYTHON, str(script)] + extra_args
     if dry_run:
         cmd.append("--dry-run")
 
@@ -517,34 +753,36 @@ def execute_approval(
     _preexec = _set_subprocess_limits if _HAVE_RESOURCE else None
 
     try:
+        # Every real dispatch is a subprocess, even for pure-Python skills:
+        # on timeout it is killed, so a send can't land after the approval
+        # has already been routed to Failed/, and it runs under the rlimits.
         result = subprocess.run(
-            cmd, capture_output=True, text=True,
+            cmd, capture_output=True,
             timeout=_timeout, preexec_fn=_preexec,
         )
-        output_raw = result.stdout.strip()
+        _cached_now.set(datetime.now(timezone.utc))  # dispatch may take minutes
+        # Bytes in, bytes to json.loads — no locale decode or strip() copy on
+        # the happy path; odd encodings only matter for the raw fallback.
         try:
-            output = json.loads(output_raw)
-        except json.JSONDecodeError:
-            output = {"raw": output_raw}
+            output = json.loads(result.stdout)
+        except ValueError:
+            output = {"raw": result.stdout.decode("utf-8", "replace").strip()}
 
         success = result.returncode == 0 and output.get("status") not in ("error", "failed")
         new_status = output.get("status", "sent" if success else "failed")
-        stderr_snippet = result.stderr.strip()[:400] if result.stderr else ""
+        stderr_snippet = result.stderr.decode("utf-8", "replace").strip()[:400] if result.stderr else ""
 
         # ── Update approval file ──────────────────────────────────────────
-        updated_text = re.sub(r"^status:\s*.+$", f"status: {new_status}", text, flags=re.MULTILINE)
+        updated_text = _set_status(text, new_status)
         updated_text += f"\n<!-- executed_at: {_ts()} -->\n"
         if not success and stderr_snippet:
             updated_text += f"<!-- error: {stderr_snippet[:200]} -->\n"
-        approval_file.write_text(updated_text, encoding="utf-8")
 
         # ── Route: success → Done/, failure → Failed/ ─────────────────────
         dest_dir = vault / "Done" if success else _failed_dir
         dest_dir.mkdir(parents=True, exist_ok=True)
-        dest = dest_dir / approval_file.name
-        if dest.exists():
-            dest = dest.with_name(f"{dest.stem}_{int(datetime.now().timestamp())}.md")
-        approval_file.rename(dest)
+        dest = _relocate_or_report(vault, approval_file, dest_dir, updated_text, action, trace_id)
+        destination = ("Done" if success else "Failed") if dest else "Approved"
 
         # ── Alert on failure ──────────────────────────────────────────────
         if not success:
@@ -555,14 +793,16 @@ def execute_approval(
                result="success" if success else "error",
                output=output, returncode=result.returncode,
                stderr=stderr_snippet or None,
-               destination="Done" if success else "Failed",
+               destination=destination,
                **( {"trace_id": trace_id} if trace_id else {} ))
 
         _record_metric("actions_success" if success else "actions_failed", vault)
 
         status_icon = "✓" if success else "✗"
         print(f"  {status_icon} {new_status.upper()}", end="")
-        if not success:
+        if dest is None:
+            print(f"  ⚠ could not move {approval_file.name} out of Approved/ (see move_error)")
+        elif not success:
             print(f" → vault/Failed/{dest.name}")
             if stderr_snippet:
                 print(f"  stderr: {stderr_snippet[:200]}")
@@ -574,23 +814,20 @@ def execute_approval(
             "action": action,
             "file":   approval_file.name,
             "result": output,
-            "destination": "Done" if success else "Failed",
+            "destination": destination,
         }
 
     except subprocess.TimeoutExpired:
-        updated_text = re.sub(r"^status:\s*.+$", "status: timeout", text, flags=re.MULTILINE)
+        _cached_now.set(datetime.now(timezone.utc))
+        updated_text = _set_status(text, "timeout")
         updated_text += f"\n<!-- executed_at: {_ts()} -->\n<!-- error: timed out after {_timeout}s -->\n"
-        approval_file.write_text(updated_text, encoding="utf-8")
-        dest = _failed_dir / approval_file.name
-        if dest.exists():
-            dest = dest.with_name(f"{dest.stem}_{int(datetime.now().timestamp())}.md")
-        approval_file.rename(dest)
+        dest = _relocate_or_report(vault, approval_file, _failed_dir, updated_text, action, trace_id)
         _alert_failure(vault, approval_file.name, action, f"Timed out after {_timeout}s")
         _audit(vault, "action_timeout", action=action, file=approval_file.name,
                destination="Failed", timeout_secs=_timeout,
                **( {"trace_id": trace_id} if trace_id else {} ))
         _record_metric("actions_failed", vault)
-        print(f"  ✗ TIMEOUT → vault/Failed/{dest.name}")
+        print(f"  ✗ TIMEOUT → vault/Failed/{dest.name if dest else '(move failed)'}")
         return {"status": "error", "reason": f"Script timed out after {_timeout}s.", "file": approval_file.name}
 
     except Exception as exc:
@@ -615,25 +852,127 @@ def _retry_failed(vault: Path, failed_dir: Path, approved_dir: Path) -> int:
     for f in files:
         # Reset status to 'approved' in frontmatter before re-queuing
         text = f.read_text(encoding="utf-8")
-        text = re.sub(r"^status:\s*.+$", "status: approved", text, flags=re.MULTILINE)
+        text = _set_status(text, "approved")
         # Strip old executed_at / error comments
         text = re.sub(r"\n<!-- (executed_at|error):.*?-->\n", "\n", text)
         dest = approved_dir / f.name
         if dest.exists():
-            dest = dest.with_name(f"{dest.stem}_{int(datetime.now().timestamp())}.md")
+            dest = dest.with_name(f"{dest.stem}_{int(_now().timestamp())}.md")
         f.write_text(text, encoding="utf-8")
         f.rename(dest)
         print(f"  ↩ {f.name} → Approved/")
     return 0
 
 
-def _run_once(vault: Path, approved_dir: Path, dry_run: bool, once_file: str | None) -> int:
+def _watch_approved(approved_dir: Path):
+    """Start a watchdog observer that wakes loop mode when an approval lands.
+
+    Returns (wake_event, observer), or (None, None) if watchdog is not
+    installed — loop mode then falls back to plain interval polling.
+    """
+    try:
+        from watchdog.observers import Observer
+        from watchdog.events import FileSystemEventHandler
+    except ImportError:
+        return None, None
+
+    wake = threading.Event()
+
+    class _ApprovedHandler(FileSystemEventHandler):
+        """Sets the wake event for APPROVAL_*.md files created/moved into Approved/."""
+
+        def on_any_event(self, event):
+            if event.is_directory or event.event_type not in ("created", "moved", "closed"):
+                return
+            path = Path(getattr(event, "dest_path", "") or event.src_path)
+            if path.parent == approved_dir and path.name.startswith("APPROVAL_") and path.suffix == ".md":
+                wake.set()
+
+    observer = Observer()
+    observer.schedule(_ApprovedHandler(), str(approved_dir), recursive=False)
+    observer.start()
+    return wake, observer
+
+
+def _is_approval(name: str) -> bool:
+    return name.startswith("APPROVAL_") and name.endswith(".md")
+
+
+def _list_approvals(approved_dir: Path) -> list[Path]:
+    """Return APPROVAL_*.md files oldest first.
+
+    scandir filters by name without touching the inode; sorting still costs one
+    stat() per matching entry (on POSIX, DirEntry only caches it after the call).
+    """
+    with os.scandir(approved_dir) as it:
+        entries = [e for e in it if _is_approval(e.name)]
+    entries.sort(key=lambda e: e.stat().st_mtime)
+    return [Path(e.path) for e in entries]
+
+
+# ---------------------------------------------------------------------------
+# Loop-mode listing cache
+# ---------------------------------------------------------------------------
+# Approvals left in Approved/ after a batch (expired, rate-limited, malformed,
+# dry-run) are remembered by name → (mtime_ns, ctime_ns) and not re-read on
+# later ticks unless the file changes, is moved back in (rename bumps ctime),
+# or the rate-limit hour rolls over — which is when rate-limited ones can run.
+
+_seen_approvals: dict = {"bucket": None, "files": {}}
+
+
+def _new_approvals(approved_dir: Path) -> list[Path]:
+    """Return approvals not already seen unchanged, oldest first."""
+    bucket = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H")
+    if _seen_approvals["bucket"] != bucket:
+        _seen_approvals["bucket"] = bucket
+        _seen_approvals["files"] = {}
+    seen = _seen_approvals["files"]
+
+    present: dict[str, tuple[int, int]] = {}
+    fresh: list[tuple[int, str]] = []
+    with os.scandir(approved_dir) as it:
+        for entry in it:
+            if not _is_approval(entry.name):
+                continue
+            st = entry.stat()
+            stamp = present[entry.name] = (st.st_mtime_ns, st.st_ctime_ns)
+            if seen.get(entry.name) != stamp:
+                fresh.append((st.st_mtime_ns, entry.path))
+
+    # Forget files that have left Approved/
+    _seen_approvals["files"] = {n: seen[n] for n in seen.keys() & present.keys()}
+    fresh.sort()
+    return [Path(path) for _, path in fresh]
+
+
+def _remember_leftovers(files: list[Path]) -> None:
+    """Record approvals still sitting in Approved/ after a batch."""
+    seen = _seen_approvals["files"]
+    for f in files:
+        try:
+            st = f.stat()
+        except FileNotFoundError:
+            continue
+        seen[f.name] = (st.st_mtime_ns, st.st_ctime_ns)
+
+
+def _run_once(
+    vault: Path,
+    approved_dir: Path,
+    dry_run: bool,
+    once_file: str | None,
+    files: list[Path] | None = None,
+) -> int:
     """Process one batch of approvals concurrently.
 
     Non-Playwright actions (email, API calls) run in parallel via
     ThreadPoolExecutor. Each Playwright action launches its own subprocess
     with a fresh browser context, so multiple Playwright actions also run
-    concurrently (up to MAX_WORKERS_PLAYWRIGHT).
+    concurrently (up to MAX_WORKERS).
+
+    ``files`` lets loop mode pass a pre-filtered listing; otherwise every
+    APPROVAL_*.md in approved_dir is processed.
 
     Returns exit code: 0=ok, 1=errors.
     """
@@ -644,30 +983,34 @@ def _run_once(vault: Path, approved_dir: Path, dry_run: bool, once_file: str | N
         if not files[0].exists():
             print(f"ERROR: File not found: {files[0]}", file=sys.stderr)
             return 1
-    else:
-        files = sorted(approved_dir.glob("APPROVAL_*.md"), key=lambda p: p.stat().st_mtime)
+    elif files is None:
+        files = _list_approvals(approved_dir)
 
     if not files:
         return 0
 
     print(f"Found {len(files)} approval(s) to process{' [DRY RUN]' if dry_run else ''}.\n")
 
-    # Playwright actions get their own limited pool (browser startup is heavy)
+    # Every action shares this pool; 4 workers also caps concurrent Playwright
+    # browser launches, which are the heavy ones
     MAX_WORKERS = 4
 
     results: list[dict] = []
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
-        futures = {
-            pool.submit(execute_approval, f, vault, dry_run, failed_dir): f
-            for f in files
-        }
-        for future in as_completed(futures):
-            try:
-                r = future.result()
-            except Exception as exc:
-                f = futures[future]
-                r = {"status": "error", "reason": str(exc), "file": f.name}
-            results.append(r)
+    try:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            futures = {
+                pool.submit(execute_approval, f, vault, dry_run, failed_dir): f
+                for f in files
+            }
+            for future in as_completed(futures):
+                try:
+                    r = future.result()
+                except Exception as exc:
+                    f = futures[future]
+                    r = {"status": "error", "reason": str(exc), "file": f.name}
+                results.append(r)
+    finally:
+        _flush_audit()
 
     success = sum(1 for r in results if r["status"] in ("success", "dry_run"))
     errors  = sum(1 for r in results if r["status"] == "error")
@@ -694,12 +1037,12 @@ def main() -> None:
 
     mode = parser.add_mutually_exclusive_group()
     mode.add_argument("--loop", action="store_true",
-                      help="Run continuously, polling every --interval seconds (PM2 mode)")
+                      help="Run continuously, waking on new approvals (PM2 mode)")
     mode.add_argument("--retry-failed", action="store_true",
                       help="Move all files from vault/Failed/ back to Approved/ for retry")
     parser.add_argument("--interval", type=int, default=30,
                         metavar="SECS",
-                        help="Poll interval in seconds for --loop mode (default: 30)")
+                        help="Max seconds between rescans in --loop mode (default: 30)")
     args = parser.parse_args()
 
     vault        = Path(args.vault).expanduser().resolve()
@@ -709,6 +1052,10 @@ def main() -> None:
     failed_dir.mkdir(parents=True, exist_ok=True)
     (vault / "Logs").mkdir(parents=True, exist_ok=True)
 
+    missing = sorted(set(_ACTION_SCRIPTS) - set(_ACTION_SCRIPTS_RESOLVED))
+    if missing:
+        _log.warning(f"Skill scripts not found — these actions will fail: {', '.join(missing)}")
+
     # Load persisted state from disk
     _load_rate_state(vault)
     _load_metrics(vault)
@@ -723,27 +1070,45 @@ def main() -> None:
             level=logging.INFO,
         )
         log = logging.getLogger("ApprovalExecutor")
-        log.info(f"Loop mode started (interval={args.interval}s). Ctrl+C to stop.")
-        while True:
-            try:
-                files = list(approved_dir.glob("APPROVAL_*.md"))
-                if files:
-                    log.info(f"{len(files)} approval(s) pending — processing...")
-                    _run_once(vault, approved_dir, args.dry_run, None)
+        # Wake on filesystem events; --interval stays as a safety-net rescan
+        wake, observer = _watch_approved(approved_dir)
+        log.info(
+            f"Loop mode started ({'event-driven, ' if wake else ''}interval={args.interval}s). "
+            "Ctrl+C to stop."
+        )
+        try:
+            while True:
+                try:
+                    files = _new_approvals(approved_dir)
+                    if files:
+                        log.info(f"{len(files)} approval(s) pending — processing...")
+                        _run_once(vault, approved_dir, args.dry_run, None, files=files)
+                        _remember_leftovers(files)
+                    else:
+                        log.debug("No approvals pending.")
+                except KeyboardInterrupt:
+                    log.info("Shutdown requested — exiting cleanly.")
+                    break
+                except Exception as exc:
+                    log.error(f"Unhandled error: {exc}", exc_info=True)
+                    _audit(vault, "executor_error", error=str(exc))
+                finally:
+                    _flush_audit()
+                if wake is not None:
+                    wake.wait(args.interval)
+                    wake.clear()
                 else:
-                    log.debug("No approvals pending.")
-            except KeyboardInterrupt:
-                log.info("Shutdown requested — exiting cleanly.")
-                break
-            except Exception as exc:
-                log.error(f"Unhandled error: {exc}", exc_info=True)
-                _audit(vault, "executor_error", error=str(exc))
-            time.sleep(args.interval)
+                    time.sleep(args.interval)
+        finally:
+            if observer is not None:
+                observer.stop()
+                observer.join()
     else:
-        if not list(approved_dir.glob("APPROVAL_*.md")) and not args.once_file:
+        files = None if args.once_file else _list_approvals(approved_dir)
+        if not args.once_file and not files:
             print("No pending approvals found in vault/Approved/")
             sys.exit(0)
-        sys.exit(_run_once(vault, approved_dir, args.dry_run, args.once_file))
+        sys.exit(_run_once(vault, approved_dir, args.dry_run, args.once_file, files=files))
 
 
 if __name__ == "__main__":
@@ -36,6 +36,11 @@ try:
 except ImportError:
     sys.exit("Missing dependency. Run:  pip install requests")
 
+try:
+    import orjson  # optional: faster JSON encoding for the printed result
+except ImportError:
+    orjson = None
+
 try:
     from dotenv import load_dotenv
     _PROJECT_DIR = Path(__file__).resolve().parents[4]
@@ -47,11 +52,42 @@ _GRAPH_API_VERSION = "v21.0"
 _GRAPH_API_BASE    = f"https://graph.facebook.com/{_GRAPH_API_VERSION}"
 _MAX_CONTENT_LEN   = 63206
 
+# One keep-alive session for every Graph API call in a run (page-token lookup
+# and publish) so they share a single TLS connection to graph.facebook.com.
+_SESSION = requests.Session()
+
 
 def _ts() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+# _emit, _result and _graph_error are deliberately identical to the copies in
+# instagram-poster/scripts/create_post.py — each skill script runs standalone,
+# with no shared import path, so change both together.
+def _emit(obj, indent: bool = False) -> None:
+    """Write obj to stdout as JSON — orjson when installed, stdlib json otherwise."""
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    else:
+        data = json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+    sys.stdout.flush()
+    sys.stdout.buffer.write(data + b"\n")
+    sys.stdout.flush()
+
+
+def _result(status: str, ts: str, **extra) -> dict:
+    """Build a result dict: status first, timestamp last, extras in between."""
+    return {"status": status, **extra, "timestamp": ts}
+
+
+def _graph_error(resp: requests.Response) -> dict:
+    """Return the Graph API ``error`` object, or the raw body if it isn't JSON."""
+    try:
+        return resp.json().get("error", {})
+    except Exception:
+        return {"message": resp.text}
+
+
 def _get_page_access_token() -> tuple[str, str]:
     """
     Returns (page_id, page_access_token).
@@ -69,7 +105,7 @@ def _get_page_access_token() -> tuple[str, str]:
         return "", ""
 
     # Strategy 1: derive page token from /me/accounts
-    resp = requests.get(
+    resp = _SESSION.get(
         f"{_GRAPH_API_BASE}/me/accounts",
         params={"access_token": user_token, "fields": "id,name,access_token"},
         timeout=15,
@@ -81,7 +117,7 @@ def _get_page_access_token() -> tuple[str, str]:
 
     # Strategy 2: query the page directly (works for new-style pages)
     if page_id:
-        resp2 = requests.get(
+        resp2 = _SESSION.get(
             f"{_GRAPH_API_BASE}/{page_id}",
             params={"fields": "id,name,access_token", "access_token": user_token},
             timeout=15,
@@ -96,49 +132,45 @@ def _get_page_access_token() -> tuple[str, str]:
 
 
 def create_post(content: str, dry_run: bool = False) -> dict:
-    if not content.strip():
-        return {"status": "error", "error": "Post content is empty.", "timestamp": _ts()}
+    ts = _ts()  # one timestamp for every result this call returns
+    n  = len(content)
+    if n > _MAX_CONTENT_LEN:  # before strip(), which copies the whole string
+        return _result(
+            "error", ts,
+            error=f"Content exceeds Facebook limit ({n}/{_MAX_CONTENT_LEN} chars).",
+        )
 
-    if len(content) > _MAX_CONTENT_LEN:
-        return {
-            "status":    "error",
-            "error":     f"Content exceeds Facebook limit ({len(content)}/{_MAX_CONTENT_LEN} chars).",
-            "timestamp": _ts(),
-        }
+    if not content.strip():
+        return _result("error", ts, error="Post content is empty.")
 
     if dry_run:
-        return {
-            "status":      "dry_run",
-            "content_len": len(content),
-            "preview":     content[:120] + ("..." if len(content) > 120 else ""),
-            "timestamp":   _ts(),
-        }
+        return _result(
+            "dry_run", ts,
+            content_len = n,
+            preview     = content[:120] + ("..." if n > 120 else ""),
+        )
 
     page_id, page_token = _get_page_access_token()
     if not page_id or not page_token:
-        return {
-            "status":    "error",
-            "error":     (
+        return _result(
+            "error", ts,
+            error=(
                 "Missing Facebook credentials. Set FACEBOOK_PAGE_ACCESS_TOKEN + FACEBOOK_PAGE_ID, "
                 "or FACEBOOK_ACCESS_TOKEN + FACEBOOK_PAGE_ID in .env. See SKILL.md for setup."
             ),
-            "timestamp": _ts(),
-        }
+        )
 
     try:
-        resp = requests.post(
+        resp = _SESSION.post(
             f"{_GRAPH_API_BASE}/{page_id}/feed",
             data={"message": content, "access_token": page_token},
             timeout=30,
         )
     except requests.RequestException as exc:
-        return {"status": "error", "error": f"Network error: {exc}", "timestamp": _ts()}
+        return _result("error", ts, error=f"Network error: {exc}")
 
     if resp.status_code != 200:
-        try:
-            err = resp.json().get("error", {})
-        except Exception:
-            err = {"message": resp.text}
+        err = _graph_error(resp)
 
         error_msg  = err.get("message", "Unknown error")
         error_code = err.get("code", resp.status_code)
@@ -149,23 +181,17 @@ def create_post(content: str, dry_run: bool = False) -> dict:
                 "so the script auto-fetches a new one from FACEBOOK_ACCESS_TOKEN."
             )
 
-        return {
-            "status":     "error",
-            "error":      error_msg,
-            "error_code": error_code,
-            "timestamp":  _ts(),
-        }
+        return _result("error", ts, error=error_msg, error_code=error_code)
 
     post_id  = resp.json().get("id", "")
     post_url = f"https://www.facebook.com/{post_id}" if post_id else f"https://www.facebook.com/{page_id}"
 
-    return {
-        "status":          "posted",
-        "post_id":         post_id,
-        "url":             post_url,
-        "content_preview": content[:80] + ("..." if len(content) > 80 else ""),
-        "timestamp":       _ts(),
-    }
+    return _result(
+        "posted", ts,
+        post_id         = post_id,
+        url             = post_url,
+        content_preview = content[:80] + ("..." if n > 80 else ""),
+    )
 
 
 def main() -> None:
@@ -179,15 +205,15 @@ def main() -> None:
     if args.content_file:
         cf = Path(args.content_file).expanduser()
         if not cf.exists():
-            print(json.dumps({"status": "error", "error": f"content-file not found: {cf}"}))
+            _emit({"status": "error", "error": f"content-file not found: {cf}"})
             sys.exit(1)
-        content = cf.read_text(encoding="utf-8")
+        content = cf.read_bytes().decode("utf-8")
 
     if not content.strip():
         parser.error("Post content is empty. Provide --content or --content-file.")
 
     result = create_post(content=content, dry_run=args.dry_run)
-    print(json.dumps(result, indent=2))
+    _emit(result, indent=True)
     sys.exit(0 if result["status"] in ("posted", "dry_run") else 1)
 
 
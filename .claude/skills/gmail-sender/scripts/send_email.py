@@ -17,7 +17,6 @@ import base64
 import json
 import sys
 from datetime import datetime, timezone
-from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from pathlib import Path
 
@@ -25,16 +24,22 @@ from pathlib import Path
 # Dependency guard
 # ---------------------------------------------------------------------------
 try:
+    import requests
     from google.oauth2.credentials import Credentials
-    from google.auth.transport.requests import Request
+    from google.auth.transport.requests import AuthorizedSession, Request
     from googleapiclient.discovery import build
     from googleapiclient.errors import HttpError
 except ImportError:
     sys.exit(
         "Missing dependency. Run:\n"
-        "  pip install google-auth google-auth-oauthlib google-api-python-client"
+        "  pip install google-auth google-auth-oauthlib google-api-python-client requests"
     )
 
+try:
+    import orjson  # optional: faster JSON encoding for the printed result
+except ImportError:
+    orjson = None
+
 # ---------------------------------------------------------------------------
 # Defaults (resolved relative to this script's project root)
 # ---------------------------------------------------------------------------
@@ -46,6 +51,9 @@ _DEFAULT_CREDENTIALS = _PROJECT_DIR / "watchers" / ".secrets" / "gmail_credentia
 SCOPES = ["https://www.googleapis.com/auth/gmail.send",
           "https://www.googleapis.com/auth/gmail.readonly"]
 
+_BATCH_LIMIT = 100  # max sub-requests per Gmail batch call
+_SEND_URL    = "https://gmail.googleapis.com/gmail/v1/users/me/messages/send"
+
 
 def _load_credentials(token_path: Path, creds_path: Path) -> Credentials:
     if not token_path.exists():
@@ -62,8 +70,7 @@ def _load_credentials(token_path: Path, creds_path: Path) -> Credentials:
                 f"Gmail credentials not found: {creds_path}\n"
                 "Set GMAIL_CREDENTIALS in your .env file."
             )
-        import google.auth.transport.requests as _rq
-        creds.refresh(_rq.Request())
+        creds.refresh(Request())
         token_path.write_text(creds.to_json(), encoding="utf-8")
 
     if not creds.valid:
@@ -72,15 +79,59 @@ def _load_credentials(token_path: Path, creds_path: Path) -> Credentials:
     return creds
 
 
+def _gmail_service(creds: Credentials):
+    # static_discovery uses the discovery document bundled with
+    # google-api-python-client — no HTTP fetch before the first real call.
+    return build("gmail", "v1", credentials=creds, cache_discovery=False, static_discovery=True)
+
+
+def _result(status: str, ts: str, **extra) -> dict:
+    """Build a result dict: status first, timestamp last, extras in between."""
+    return {"status": status, **extra, "timestamp": ts}
+
+
+def _emit(obj, indent: bool = False) -> None:
+    """Write obj to stdout as JSON — orjson when installed, stdlib json otherwise."""
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    else:
+        data = json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+    sys.stdout.flush()
+    sys.stdout.buffer.write(data + b"\n")
+    sys.stdout.flush()
+
+
+def _plain_ascii(to: str, subject: str, body: str, reply_to: str | None) -> bool:
+    """True if the message can be written as 7bit ASCII without any MIME encoding."""
+    headers = (to, subject, reply_to or "")
+    if not all(h.isascii() and "\n" not in h and "\r" not in h for h in headers):
+        return False
+    if not body.isascii() or len(subject) > 900:
+        return False
+    return all(len(line) <= 998 for line in body.splitlines())  # RFC 5322 line limit
+
+
 def _build_message(to: str, subject: str, body: str, reply_to: str | None = None) -> dict:
-    msg = MIMEMultipart("alternative")
+    # Pure-ASCII mail goes out as a hand-built 7bit text/plain message, skipping
+    # the email package's charset and transfer-encoding machinery.
+    if _plain_ascii(to, subject, body, reply_to):
+        lines = [f"To: {to}", f"Subject: {subject}"]
+        if reply_to:
+            lines += [f"In-Reply-To: {reply_to}", f"References: {reply_to}"]
+        lines += ["MIME-Version: 1.0",
+                  'Content-Type: text/plain; charset="us-ascii"',
+                  "Content-Transfer-Encoding: 7bit"]
+        raw = ("\n".join(lines) + "\n\n" + body).encode("ascii")
+        return {"raw": base64.urlsafe_b64encode(raw).decode("ascii")}
+
+    # Plain text only — a single text/plain part, no multipart/alternative envelope
+    msg = MIMEText(body, "plain", "utf-8")
     msg["To"]      = to
     msg["Subject"] = subject
     if reply_to:
         msg["In-Reply-To"] = reply_to
         msg["References"]  = reply_to
 
-    msg.attach(MIMEText(body, "plain", "utf-8"))
     raw = base64.urlsafe_b64encode(msg.as_bytes()).decode("utf-8")
     return {"raw": raw}
 
@@ -97,43 +148,63 @@ def send_email(
     ts = datetime.now(timezone.utc).isoformat()
 
     if dry_run:
-        return {
-            "status":       "dry_run",
-            "would_send_to": to,
-            "subject":       subject,
-            "body_preview":  body[:120] + ("..." if len(body) > 120 else ""),
-            "timestamp":     ts,
-        }
+        return _result(
+            "dry_run", ts,
+            would_send_to = to,
+            subject       = subject,
+            body_preview  = body[:120] + ("..." if len(body) > 120 else ""),
+        )
 
     creds   = _load_credentials(token_path, creds_path)
-    service = build("gmail", "v1", credentials=creds)
     message = _build_message(to, subject, body, reply_to)
 
-    sent = service.users().messages().send(userId="me", body=message).execute()
-    return {
-        "status":     "sent",
-        "message_id": sent.get("id"),
-        "to":         to,
-        "subject":    subject,
-        "timestamp":  ts,
-    }
+    # A single POST — sending doesn't need the discovery client's Resource tree
+    with AuthorizedSession(creds) as session:
+        resp = session.post(_SEND_URL, json=message, timeout=30)
+    if not resp.ok:
+        raise requests.HTTPError(f"{resp.status_code} {resp.reason}: {resp.text[:500]}",
+                                 response=resp)
+    sent = resp.json()
+    return _result("sent", ts, message_id=sent.get("id"), to=to, subject=subject)
 
 
 def list_sent(token_path: Path, creds_path: Path, limit: int = 5) -> list[dict]:
     creds   = _load_credentials(token_path, creds_path)
-    service = build("gmail", "v1", credentials=creds)
+    service = _gmail_service(creds)
     results = service.users().messages().list(
         userId="me", labelIds=["SENT"], maxResults=limit
     ).execute()
+    ids = [m["id"] for m in results.get("messages", [])]
+
+    # One multipart batch call per 100 ids instead of a round-trip per message
+    fetched: dict[str, dict] = {}
+    errors: list[Exception] = []
+
+    def _collect(request_id, response, exception):
+        if exception is not None:
+            errors.append(exception)
+        else:
+            fetched[request_id] = response
+
+    for start in range(0, len(ids), _BATCH_LIMIT):
+        batch = service.new_batch_http_request(callback=_collect)
+        for msg_id in ids[start:start + _BATCH_LIMIT]:
+            batch.add(
+                service.users().messages().get(
+                    userId="me", id=msg_id, format="metadata",
+                    metadataHeaders=["To", "Subject", "Date"]
+                ),
+                request_id=msg_id,
+            )
+        batch.execute()
+    if errors:
+        raise errors[0]
+
     messages = []
-    for m in results.get("messages", []):
-        msg = service.users().messages().get(
-            userId="me", id=m["id"], format="metadata",
-            metadataHeaders=["To", "Subject", "Date"]
-        ).execute()
-        headers = {h["name"]: h["value"] for h in msg["payload"]["headers"]}
+    for msg_id in ids:
+        headers = {h["name"]: h["value"] for h in fetched[msg_id]["payload"]["headers"]}
         messages.append({
-            "id":      m["id"],
+            "id":      msg_id,
             "to":      headers.get("To", ""),
             "subject": headers.get("Subject", ""),
             "date":    headers.get("Date", ""),
@@ -168,9 +239,9 @@ def main() -> None:
     if args.list_sent:
         try:
             sent = list_sent(token_path, creds_path, args.limit)
-            print(json.dumps(sent, indent=2))
+            _emit(sent, indent=True)
         except Exception as exc:
-            print(json.dumps({"status": "error", "error": str(exc)}))
+            _emit({"status": "error", "error": str(exc)})
             sys.exit(1)
         return
 
@@ -184,9 +255,9 @@ def main() -> None:
     if args.body_file:
         bf = Path(args.body_file).expanduser()
         if not bf.exists():
-            print(json.dumps({"status": "error", "error": f"body-file not found: {bf}"}))
+            _emit({"status": "error", "error": f"body-file not found: {bf}"})
             sys.exit(1)
-        body = bf.read_text(encoding="utf-8")
+        body = bf.read_bytes().decode("utf-8")
 
     if not body.strip():
         parser.error("Email body is empty. Provide --body or --body-file.")
@@ -201,21 +272,13 @@ def main() -> None:
             reply_to    = args.reply_to,
             dry_run     = args.dry_run,
         )
-        print(json.dumps(result))
-        sys.exit(0 if result["status"] in ("sent", "dry_run") else 1)
-
-    except FileNotFoundError as exc:
-        print(json.dumps({"status": "error", "error": str(exc),
-                          "timestamp": datetime.now(timezone.utc).isoformat()}))
-        sys.exit(1)
-    except HttpError as exc:
-        print(json.dumps({"status": "error", "error": f"Gmail API error: {exc}",
-                          "timestamp": datetime.now(timezone.utc).isoformat()}))
-        sys.exit(1)
+    except (HttpError, requests.HTTPError) as exc:
+        result = _result("error", datetime.now(timezone.utc).isoformat(),
+                         error=f"Gmail API error: {exc}")
     except Exception as exc:
-        print(json.dumps({"status": "error", "error": str(exc),
-                          "timestamp": datetime.now(timezone.utc).isoformat()}))
-        sys.exit(1)
+        result = _result("error", datetime.now(timezone.utc).isoformat(), error=str(exc))
+    _emit(result)
+    sys.exit(0 if result["status"] in ("sent", "dry_run") else 1)
 
 
 if __name__ == "__main__":
@@ -35,6 +35,11 @@ try:
 except ImportError:
     sys.exit("Missing dependency. Run:  pip install requests")
 
+try:
+    import orjson  # optional: faster JSON encoding for the printed result
+except ImportError:
+    orjson = None
+
 try:
     from dotenv import load_dotenv
     _PROJECT_DIR = Path(__file__).resolve().parents[4]
@@ -47,11 +52,42 @@ _GRAPH_API_BASE    = f"https://graph.facebook.com/{_GRAPH_API_VERSION}"
 _MAX_CAPTION_LEN   = 2200
 _PUBLISH_TIMEOUT_S = 90   # max seconds to wait for media container to be ready
 
+# One keep-alive session for every Graph API call in a run (token lookup,
+# publish, polling) so they share a single TLS connection to graph.facebook.com.
+_SESSION = requests.Session()
+
 
 def _ts() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+# _emit, _result and _graph_error are deliberately identical to the copies in
+# facebook-poster/scripts/create_post.py — each skill script runs standalone,
+# with no shared import path, so change both together.
+def _emit(obj, indent: bool = False) -> None:
+    """Write obj to stdout as JSON — orjson when installed, stdlib json otherwise."""
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    else:
+        data = json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+    sys.stdout.flush()
+    sys.stdout.buffer.write(data + b"\n")
+    sys.stdout.flush()
+
+
+def _result(status: str, ts: str, **extra) -> dict:
+    """Build a result dict: status first, timestamp last, extras in between."""
+    return {"status": status, **extra, "timestamp": ts}
+
+
+def _graph_error(resp: requests.Response) -> dict:
+    """Return the Graph API ``error`` object, or the raw body if it isn't JSON."""
+    try:
+        return resp.json().get("error", {})
+    except Exception:
+        return {"message": resp.text}
+
+
 def _get_credentials() -> tuple[str, str]:
     """
     Returns (instagram_user_id, access_token).
@@ -76,7 +112,7 @@ def _get_credentials() -> tuple[str, str]:
     if not page_id:
         return "", ""
 
-    resp = requests.get(
+    resp = _SESSION.get(
         f"{_GRAPH_API_BASE}/{page_id}",
         params={"fields": "instagram_business_account", "access_token": access_token},
         timeout=15,
@@ -91,17 +127,22 @@ def _get_credentials() -> tuple[str, str]:
 def _resolve_image_url(url: str) -> str:
     """Follow redirects and return the final URL (Instagram API requires direct links)."""
     try:
-        resp = requests.head(url, allow_redirects=True, timeout=10)
+        resp = _SESSION.head(url, allow_redirects=True, timeout=10)
         return resp.url
     except Exception:
         return url  # fall back to original if HEAD fails
 
 
 def _wait_for_container(creation_id: str, access_token: str) -> bool:
-    """Poll until the media container status is FINISHED or timeout."""
-    deadline = time.time() + _PUBLISH_TIMEOUT_S
-    while time.time() < deadline:
-        resp = requests.get(
+    """Poll until the media container status is FINISHED or timeout.
+
+    Checks straight away and backs off 0.5s → 1s → 2s → 4s, so small images
+    that finish in under a second aren't held behind a fixed 4s sleep.
+    """
+    deadline = time.monotonic() + _PUBLISH_TIMEOUT_S
+    delay = 0.5
+    while True:
+        resp = _SESSION.get(
             f"{_GRAPH_API_BASE}/{creation_id}",
             params={"fields": "status_code", "access_token": access_token},
             timeout=15,
@@ -112,55 +153,56 @@ def _wait_for_container(creation_id: str, access_token: str) -> bool:
                 return True
             if status == "ERROR":
                 return False
-        time.sleep(4)
-    return False
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 4)
 
 
 def create_post(caption: str, image_url: str, dry_run: bool = False) -> dict:
-    if not caption.strip():
-        return {"status": "error", "error": "Caption is empty.", "timestamp": _ts()}
+    ts = _ts()  # one timestamp for every result this call returns
+    n  = len(caption)
+    if n > _MAX_CAPTION_LEN:  # before strip(), which copies the whole string
+        return _result(
+            "error", ts,
+            error=f"Caption exceeds Instagram limit ({n}/{_MAX_CAPTION_LEN} chars).",
+        )
 
-    if len(caption) > _MAX_CAPTION_LEN:
-        return {
-            "status":    "error",
-            "error":     f"Caption exceeds Instagram limit ({len(caption)}/{_MAX_CAPTION_LEN} chars).",
-            "timestamp": _ts(),
-        }
+    if not caption.strip():
+        return _result("error", ts, error="Caption is empty.")
 
     if not image_url.startswith("https://"):
-        return {
-            "status":    "error",
-            "error":     "image_url must be a public HTTPS URL (Instagram API requirement).",
-            "timestamp": _ts(),
-        }
+        return _result(
+            "error", ts,
+            error="image_url must be a public HTTPS URL (Instagram API requirement).",
+        )
 
     if dry_run:
-        return {
-            "status":      "dry_run",
-            "caption_len": len(caption),
-            "image_url":   image_url,
-            "preview":     caption[:120] + ("..." if len(caption) > 120 else ""),
-            "timestamp":   _ts(),
-        }
+        return _result(
+            "dry_run", ts,
+            caption_len = n,
+            image_url   = image_url,
+            preview     = caption[:120] + ("..." if n > 120 else ""),
+        )
 
     ig_user_id, access_token = _get_credentials()
     if not ig_user_id or not access_token:
-        return {
-            "status":    "error",
-            "error":     (
+        return _result(
+            "error", ts,
+            error=(
                 "Missing Instagram credentials. Set INSTAGRAM_USER_ID + INSTAGRAM_ACCESS_TOKEN "
                 "in .env (or FACEBOOK_PAGE_ID + FACEBOOK_ACCESS_TOKEN for auto-detection). "
                 "See SKILL.md for setup."
             ),
-            "timestamp": _ts(),
-        }
+        )
 
     # Resolve any redirects — Instagram API requires a direct (non-redirect) URL
     image_url = _resolve_image_url(image_url)
 
     # Step 1: Create media container
     try:
-        resp = requests.post(
+        resp = _SESSION.post(
             f"{_GRAPH_API_BASE}/{ig_user_id}/media",
             data={
                 "image_url":    image_url,
@@ -170,63 +212,53 @@ def create_post(caption: str, image_url: str, dry_run: bool = False) -> dict:
             timeout=30,
         )
     except requests.RequestException as exc:
-        return {"status": "error", "error": f"Network error (create container): {exc}", "timestamp": _ts()}
+        return _result("error", ts, error=f"Network error (create container): {exc}")
 
     if resp.status_code not in (200, 201):
-        try:
-            err = resp.json().get("error", {})
-        except Exception:
-            err = {"message": resp.text}
+        err = _graph_error(resp)
         error_msg = err.get("message", "Unknown error")
         if resp.status_code == 401:
             error_msg += " — Token expired. Re-run watchers/auth_facebook.py or refresh INSTAGRAM_ACCESS_TOKEN."
-        return {"status": "error", "error": error_msg, "http_status": resp.status_code, "timestamp": _ts()}
+        return _result("error", ts, error=error_msg, http_status=resp.status_code)
 
     creation_id = resp.json().get("id", "")
     if not creation_id:
-        return {"status": "error", "error": "No creation_id returned from /media endpoint.", "timestamp": _ts()}
+        return _result("error", ts, error="No creation_id returned from /media endpoint.")
 
     # Step 2: Wait for container to be ready
     if not _wait_for_container(creation_id, access_token):
-        return {
-            "status":    "error",
-            "error":     f"Media container {creation_id} did not reach FINISHED state within {_PUBLISH_TIMEOUT_S}s.",
-            "timestamp": _ts(),
-        }
+        return _result(
+            "error", ts,
+            error=f"Media container {creation_id} did not reach FINISHED state within {_PUBLISH_TIMEOUT_S}s.",
+        )
 
     # Step 3: Publish
     try:
-        resp = requests.post(
+        resp = _SESSION.post(
             f"{_GRAPH_API_BASE}/{ig_user_id}/media_publish",
             data={"creation_id": creation_id, "access_token": access_token},
             timeout=30,
         )
     except requests.RequestException as exc:
-        return {"status": "error", "error": f"Network error (publish): {exc}", "timestamp": _ts()}
+        return _result("error", ts, error=f"Network error (publish): {exc}")
 
     if resp.status_code not in (200, 201):
-        try:
-            err = resp.json().get("error", {})
-        except Exception:
-            err = {"message": resp.text}
-        return {
-            "status":     "error",
-            "error":      err.get("message", "Unknown error"),
-            "http_status": resp.status_code,
-            "timestamp":  _ts(),
-        }
+        err = _graph_error(resp)
+        return _result(
+            "error", ts,
+            error=err.get("message", "Unknown error"), http_status=resp.status_code,
+        )
 
     post_id  = resp.json().get("id", "")
     post_url = f"https://www.instagram.com/p/{post_id}/" if post_id else "https://www.instagram.com/"
 
-    return {
-        "status":          "posted",
-        "post_id":         post_id,
-        "url":             post_url,
-        "image_url":       image_url,
-        "caption_preview": caption[:80] + ("..." if len(caption) > 80 else ""),
-        "timestamp":       _ts(),
-    }
+    return _result(
+        "posted", ts,
+        post_id         = post_id,
+        url             = post_url,
+        image_url       = image_url,
+        caption_preview = caption[:80] + ("..." if n > 80 else ""),
+    )
 
 
 def main() -> None:
@@ -241,7 +273,7 @@ def main() -> None:
         image_url = args.image_url,
         dry_run   = args.dry_run,
     )
-    print(json.dumps(result, indent=2))
+    _emit(result, indent=True)
     sys.exit(0 if result["status"] in ("posted", "dry_run") else 1)
 
 
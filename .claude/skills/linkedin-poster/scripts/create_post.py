@@ -164,7 +164,7 @@ def main() -> None:
         if not cf.exists():
             print(json.dumps({"status": "error", "error": f"content-file not found: {cf}"}))
             sys.exit(1)
-        content = cf.read_text(encoding="utf-8")
+        content = cf.read_bytes().decode("utf-8")
 
     if not content.strip():
         parser.error("Post content is empty. Provide --content or --content-file.")
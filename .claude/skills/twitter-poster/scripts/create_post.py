@@ -9,225 +9,476 @@ Usage:
     python create_post.py --content "Tweet text..." --session-path ~/.sessions/twitter
     python create_post.py --content-file /tmp/tweet.txt --session-path ~/.sessions/twitter
     python create_post.py --content "Tweet text..." --dry-run
+    python create_post.py --serve < requests.jsonl   # {"content": "..."} per line
+    python create_post.py --serve --dry-run < requests.jsonl   # every request dry-run
 """
 
 import argparse
 import json
 import os
+import platform
 import random
 import sys
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 
 try:
-    from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+    import orjson  # optional: faster JSON encoding for the printed result
 except ImportError:
-    sys.exit("Missing dependency. Run:  pip install playwright && playwright install chromium")
-
-try:
-    from playwright_stealth import stealth_sync
-except ImportError:
-    stealth_sync = None
+    orjson = None
 
 _DEFAULT_SESSION = Path(os.environ.get("TWITTER_SESSION_PATH", "~/.sessions/twitter")).expanduser()
 _COMPOSE_URL     = "https://x.com/compose/tweet"
 _HOME_URL        = "https://x.com/home"
 _MAX_CONTENT_LEN = 280  # Standard X character limit
 
+# Inline home-feed editor variants, as one CSS selector list so a single
+# locator matches whichever is present instead of probing them one by one.
+_INLINE_EDITOR_SEL = ", ".join((
+    "div[data-testid='tweetTextarea_0']",
+    "div[aria-label='Post text']",
+    "div[data-testid='tweetTextarea_0_label']",
+    "div[role='textbox'][aria-label*='Post']",
+    "div[role='textbox'][aria-label*='Tweet']",
+    "div[role='textbox'][aria-label*='tweet']",
+))
+
+# Modal and inline Post buttons; the ":enabled" form matches once X has
+# accepted the text and the button can be submitted.
+_POST_BUTTONS          = ("button[data-testid='tweetButton']", "button[data-testid='tweetButtonInline']")
+_POST_BUTTON_SEL       = ", ".join(_POST_BUTTONS)
+_POST_BUTTON_READY_SEL = ", ".join(f"{b}:enabled" for b in _POST_BUTTONS)
+
+_INLINE_ATTEMPT_MS = 1500  # inline editor probe
+_EDITOR_BUDGET_S   = 8     # inline probe + sidebar-modal fallback, in total
+
+# X empties the inline editor, or closes the compose modal (detaching its
+# editor), once a post goes out. Evaluated against the editor we typed into, so
+# an empty inline editor left behind the modal doesn't pass for a submit.
+_SUBMITTED_JS = "e => !e.isConnected || !e.innerText.trim()"
+
+# True when the editor holds the text we inserted (whitespace-insensitive, as
+# contenteditable turns newlines into block elements)
+_HAS_TEXT_JS = (
+    "([e, t]) => { const n = s => s.replace(/\\s+/g, ' ').trim();"
+    " return n(e.innerText).includes(n(t)); }"
+)
+
+# Stealth flag plus Chromium's background services (updaters, sync, safe-browsing
+# refresh, crash reporter…) that only cost CPU and RSS during a short post.
+_CHROMIUM_ARGS = (
+    "--disable-blink-features=AutomationControlled",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-breakpad",
+    "--disable-client-side-phishing-detection",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-extensions",
+    "--disable-hang-monitor",
+    "--disable-ipc-flooding-protection",
+    "--disable-renderer-backgrounding",
+    "--disable-sync",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--no-first-run",
+    "--no-default-browser-check",
+)
+
+# Avatars, media and webfonts are never needed to compose a post; skipping them
+# cuts most of x.com's page weight. Stylesheets stay — locators need real layout.
+_BLOCKED_RESOURCES = frozenset({"image", "media", "font"})
+
+# X's publish shortcut is Cmd+Enter on macOS, Ctrl+Enter elsewhere. Playwright
+# only knows the key as "Enter" and raises on "Return".
+_SUBMIT_KEY = "Meta+Enter" if platform.system() == "Darwin" else "Control+Enter"
+
+_LOGIN_MARKERS = ("login", "signin", "i/flow")  # URL fragments of X's login flow
+
+# True once the home timeline has rendered or X has bounced us to its login flow
+_HOME_READY_JS = (
+    "() => /login|signin|i\\/flow/.test(location.href)"
+    " || !!document.querySelector(\"div[data-testid='primaryColumn']\")"
+)
+
+
+# Playwright is imported on first real use (see _require_playwright) so dry
+# runs and validation errors never pay for loading it.
+PlaywrightTimeout = None
+stealth_sync      = None
+
+
+def _require_playwright():
+    """Import Playwright (and stealth, if installed); returns sync_playwright."""
+    global PlaywrightTimeout, stealth_sync
+    try:
+        from playwright.sync_api import sync_playwright, TimeoutError as _Timeout
+    except ImportError:
+        sys.exit("Missing dependency. Run:  pip install playwright && playwright install chromium")
+    PlaywrightTimeout = _Timeout
+    try:
+        from playwright_stealth import stealth_sync
+    except ImportError:
+        stealth_sync = None
+    return sync_playwright
+
 
 def _ts() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def create_post(
-    content: str,
-    session_path: Path,
-    headless: bool = True,
-    dry_run: bool = False,
-) -> dict:
+def _emit(obj, indent: bool = False) -> None:
+    """Write obj to stdout as JSON — orjson when installed, stdlib json otherwise."""
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    else:
+        data = json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+    sys.stdout.flush()
+    sys.stdout.buffer.write(data + b"\n")
+    sys.stdout.flush()
+
+
+def _preview(text: str, n: int) -> str:
+    return text if len(text) <= n else text[:n] + "..."
+
+
+def _debug_shot(page, tag: str, stamp: str, jpeg: bool = False) -> str:
+    """Screenshot the viewport under /tmp and return the path.
+
+    Failure shots stay PNG so UI text is legible; routine audit shots use a
+    quality-60 JPEG, which encodes several times faster and is far smaller.
+    """
+    if jpeg:
+        path = f"/tmp/{tag}_{stamp}.jpg"
+        page.screenshot(path=path, type="jpeg", quality=60)
+    else:
+        path = f"/tmp/{tag}_{stamp}.png"
+        page.screenshot(path=path)
+    return path
+
+
+def _insert_text(page, content: str) -> None:
+    """Put content into the focused editor in one step, not keystroke by keystroke."""
+    page.keyboard.insert_text(content)
+    # Some contenteditable builds drop a bare insertText; execCommand goes
+    # through the editor's own input handling instead.
+    if not page.evaluate("() => !!document.activeElement?.innerText?.trim()"):
+        page.evaluate("t => document.execCommand('insertText', false, t)", content)
+
+
+def _submitted(page, editor, timeout_ms: float) -> bool:
+    """Wait for X to clear (inline) or close (modal) the given editor after submitting."""
+    try:
+        page.wait_for_function(_SUBMITTED_JS, arg=editor, timeout=timeout_ms)
+        return True
+    except PlaywrightTimeout:
+        return False
+
+
+def _remaining_ms(deadline: float) -> float:
+    # Playwright treats timeout=0 as "no timeout", so never hand it back
+    return max(1.0, (deadline - time.monotonic()) * 1000)
+
+
+def _preflight(content: str, dry_run: bool) -> dict | None:
+    """Validate content; return the error or dry-run result, or None to go ahead."""
+    ts = _ts()
     if not content.strip():
-        return {"status": "error", "error": "Post content is empty.", "timestamp": _ts()}
+        return {"status": "error", "error": "Post content is empty.", "timestamp": ts}
 
     if len(content) > _MAX_CONTENT_LEN:
         return {
             "status":    "error",
             "error":     f"Content exceeds X character limit ({len(content)}/{_MAX_CONTENT_LEN} chars).",
-            "timestamp": _ts(),
+            "timestamp": ts,
         }
 
     if dry_run:
         return {
             "status":       "dry_run",
             "content_len":  len(content),
-            "preview":      content[:120] + ("..." if len(content) > 120 else ""),
-            "timestamp":    _ts(),
+            "preview":      _preview(content, 120),
+            "timestamp":    ts,
         }
+    return None
 
-    if not session_path.exists():
-        return {
-            "status":    "error",
-            "error":     f"Twitter session not found: {session_path}. Run: python watchers/auth_twitter.py",
-            "timestamp": _ts(),
-        }
 
-    with sync_playwright() as p:
-        context = p.chromium.launch_persistent_context(
-            str(session_path),
-            headless=headless,
-            args=["--disable-blink-features=AutomationControlled"],
-            viewport={"width": 1280, "height": 800},
-        )
-        page = context.pages[0] if context.pages else context.new_page()
-        if stealth_sync:
-            stealth_sync(page)
+def _session_missing(session_path: Path) -> dict:
+    return {
+        "status":    "error",
+        "error":     f"Twitter session not found: {session_path}. Run: python watchers/auth_twitter.py",
+        "timestamp": _ts(),
+    }
+
+
+def _block_heavy(route) -> None:
+    if route.request.resource_type in _BLOCKED_RESOURCES:
+        route.abort()
+    else:
+        route.continue_()
 
+
+def _launch(p, session_path: Path, headless: bool):
+    """Open the persistent X session; returns (context, page)."""
+    context = p.chromium.launch_persistent_context(
+        str(session_path),
+        headless=headless,
+        args=list(_CHROMIUM_ARGS),
+        viewport={"width": 1280, "height": 800},
+    )
+    context.route("**/*", _block_heavy)
+    return context, _open_page(context)
+
+
+def _open_page(context):
+    """Reuse the profile's existing tab if there is one, else open a new one."""
+    page = context.pages[0] if context.pages else context.new_page()
+    if stealth_sync:
+        stealth_sync(page)
+    return page
+
+
+def _post_on_page(page, content: str, audit: str = "none") -> dict:
+    """Publish content from an already-open, logged-in X page.
+
+    audit picks the artefact kept for a successful post: "none", "screenshot"
+    or "html". Composer and submit failures always get a screenshot.
+    """
+    ts    = _ts()  # one timestamp for every result and artefact of this post
+    stamp = ts[:19].replace("-", "").replace(":", "").replace("T", "_")  # YYYYmmdd_HHMMSS
+    try:
+        # No auth_token cookie means X will only bounce us to login — say so
+        # without loading the home feed first.
+        if not any(c["name"] == "auth_token" for c in page.context.cookies("https://x.com")):
+            return {
+                "status":    "error",
+                "error":     "Twitter/X session expired. Run: python watchers/auth_twitter.py",
+                "timestamp": ts,
+            }
+
+        # ── Navigate to home and check login state ────────────────────
+        # "commit" returns once the response starts; the readiness check
+        # below waits for the DOM we actually need rather than every script.
+        page.goto(_HOME_URL, wait_until="commit", timeout=30_000)
+        # Ready once either the timeline renders or X redirects to login
         try:
-            # ── Navigate to home and check login state ────────────────────
-            page.goto(_HOME_URL, wait_until="domcontentloaded", timeout=30_000)
-            page.wait_for_timeout(3000)
-
-            if any(kw in page.url for kw in ("login", "signin", "i/flow")):
-                return {
-                    "status":    "error",
-                    "error":     "Twitter/X session expired. Run: python watchers/auth_twitter.py",
-                    "timestamp": _ts(),
-                }
-
-            # ── Human-like browsing simulation before posting ─────────────
-            # Scroll down and back up, move mouse, pause — mimics a real user
-            # reading their feed before composing a post.
-            for _ in range(random.randint(3, 5)):
-                scroll_by = random.randint(200, 500)
-                page.evaluate(f"window.scrollBy(0, {scroll_by})")
-                page.wait_for_timeout(random.randint(800, 1800))
-
-            page.evaluate("window.scrollTo(0, 0)")
-            page.wait_for_timeout(random.randint(1000, 2000))
-
-            # Random mouse movement across the feed
-            for _ in range(random.randint(2, 4)):
-                x = random.randint(300, 800)
-                y = random.randint(200, 600)
-                page.mouse.move(x, y)
-                page.wait_for_timeout(random.randint(300, 700))
-
-            # ── Use inline home-feed composer (less detectable than /compose/tweet) ──
-            # Click the "What's happening?" placeholder on the home feed
-            inline_selectors = [
-                "div[data-testid='tweetTextarea_0']",
-                "div[aria-label='Post text']",
-                "div[data-testid='tweetTextarea_0_label']",
-                "div[role='textbox'][aria-label*='Post']",
-                "div[role='textbox'][aria-label*='Tweet']",
-                "div[role='textbox'][aria-label*='tweet']",
-            ]
-            typed = False
-            for sel in inline_selectors:
-                try:
-                    page.click(sel, timeout=5000)
-                    page.wait_for_timeout(1000)
-                    page.keyboard.type(content, delay=50)
-                    typed = True
-                    break
-                except PlaywrightTimeout:
-                    continue
+            page.wait_for_function(_HOME_READY_JS, timeout=20_000)
+        except PlaywrightTimeout:
+            pass
 
-            if not typed:
-                # Fallback: click "Post" button in left sidebar to open modal
-                try:
-                    page.click("a[data-testid='SideNav_NewTweet_Button']", timeout=5000)
-                    page.wait_for_timeout(1500)
-                    page.click("div[data-testid='tweetTextarea_0']", timeout=5000)
-                    page.wait_for_timeout(500)
-                    page.keyboard.type(content, delay=50)
-                    typed = True
-                except PlaywrightTimeout:
-                    pass
-
-            if not typed:
-                screenshot_path = f"/tmp/twitter_post_debug_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-                page.screenshot(path=screenshot_path)
-                return {
-                    "status":    "error",
-                    "error":     f"Could not find tweet editor. Screenshot: {screenshot_path}",
-                    "timestamp": _ts(),
-                }
-
-            page.wait_for_timeout(1500)
-
-            # ── Wait for Post button to become enabled, then use keyboard ──
-            # X detects programmatic button clicks as automation — Ctrl+Enter
-            # is the safest submission method.
-            posted = False
+        if any(kw in page.url for kw in _LOGIN_MARKERS):
+            return {
+                "status":    "error",
+                "error":     "Twitter/X session expired. Run: python watchers/auth_twitter.py",
+                "timestamp": ts,
+            }
+
+        # ── Human-like browsing simulation before posting ─────────────
+        # Scroll down and back up, move mouse, pause — mimics a real user
+        # reading their feed before composing a post.
+        for _ in range(random.randint(3, 5)):
+            scroll_by = random.randint(200, 500)
+            page.evaluate(f"window.scrollBy(0, {scroll_by})")
+            page.wait_for_timeout(random.randint(800, 1800))
+
+        page.evaluate("window.scrollTo(0, 0)")
+        page.wait_for_timeout(random.randint(1000, 2000))
+
+        # Random mouse movement across the feed
+        for _ in range(random.randint(2, 4)):
+            x = random.randint(300, 800)
+            y = random.randint(200, 600)
+            page.mouse.move(x, y)
+            page.wait_for_timeout(random.randint(300, 700))
+
+        # ── Use inline home-feed composer (less detectable than /compose/tweet) ──
+        # Click the "What's happening?" placeholder on the home feed
+        # The timeline has already rendered, so the inline editor is either there
+        # or it isn't: give it a short attempt, then let the modal fallback use
+        # whatever is left of one overall budget.
+        deadline = time.monotonic() + _EDITOR_BUDGET_S
+        typed = False
+        # One in-page check decides the route: with no inline editor in the DOM
+        # go straight to the modal instead of spending the probe timeout first.
+        if page.evaluate("sel => !!document.querySelector(sel)", _INLINE_EDITOR_SEL):
             try:
-                page.wait_for_function(
-                    "document.querySelector(\"button[data-testid='tweetButton']\")?.disabled === false"
-                    " || document.querySelector(\"button[data-testid='tweetButtonInline']\")?.disabled === false",
-                    timeout=6000,
-                )
-            except Exception:
+                page.locator(_INLINE_EDITOR_SEL).first.click(timeout=_INLINE_ATTEMPT_MS)  # focuses the editor
+                # One insertText call rather than a keystroke (and 50ms) per character
+                _insert_text(page, content)
+                typed = True
+            except PlaywrightTimeout:
                 pass
 
+        if not typed:
+            # Fallback: click "Post" button in left sidebar to open modal
+            try:
+                page.get_by_test_id("SideNav_NewTweet_Button").click(timeout=_remaining_ms(deadline))
+                # click() waits for the modal's editor to be attached and visible
+                page.get_by_test_id("tweetTextarea_0").first.click(timeout=_remaining_ms(deadline))
+                _insert_text(page, content)
+                typed = True
+            except PlaywrightTimeout:
+                pass
+
+        if not typed:
+            screenshot_path = _debug_shot(page, "twitter_post_debug", stamp)
+            return {
+                "status":    "error",
+                "error":     f"Could not find tweet editor. Screenshot: {screenshot_path}",
+                "timestamp": ts,
+            }
+        # Both routes leave focus in the editor that now holds the text
+        editor = page.evaluate_handle("() => document.activeElement")
+        # An editor that never got the text is already "empty", which the
+        # submit check below would read as a successful post.
+        if not page.evaluate(_HAS_TEXT_JS, [editor, content]):
+            screenshot_path = _debug_shot(page, "twitter_post_debug", stamp)
+            return {
+                "status":    "error",
+                "error":     f"Tweet text did not reach the editor. Screenshot: {screenshot_path}",
+                "timestamp": ts,
+            }
+
+        # ── Wait for Post button to become enabled, then use keyboard ──
+        # X detects programmatic button clicks as automation — Ctrl+Enter
+        # is the safest submission method.
+        posted = False
+        try:
+            page.locator(_POST_BUTTON_READY_SEL).first.wait_for(state="visible", timeout=6000)
+        except PlaywrightTimeout:
+            pass
+
+        # A key press returns whether or not X acted on it, so confirm the
+        # editor actually emptied before falling back to the JS click.
+        try:
+            page.keyboard.press(_SUBMIT_KEY)
+            posted = _submitted(page, editor, 5000)
+        except Exception:
+            pass
+
+        if not posted:
+            # Fallback: JS click to bypass automation detection
             try:
-                page.keyboard.press("Control+Return")
-                page.wait_for_timeout(2000)
-                posted = True
+                page.evaluate("sel => document.querySelector(sel)?.click()", _POST_BUTTON_SEL)
+                posted = _submitted(page, editor, 5000)
             except Exception:
                 pass
 
-            if not posted:
-                # Fallback: JS click to bypass automation detection
-                try:
-                    page.evaluate(
-                        "document.querySelector(\"button[data-testid='tweetButton']\")?.click()"
-                        " || document.querySelector(\"button[data-testid='tweetButtonInline']\")?.click()"
-                    )
-                    page.wait_for_timeout(2000)
-                    posted = True
-                except Exception:
-                    pass
-
-            if not posted:
-                screenshot_path = f"/tmp/twitter_post_debug_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-                page.screenshot(path=screenshot_path)
-                return {
-                    "status":    "error",
-                    "error":     f"Could not click Post button. Screenshot: {screenshot_path}",
-                    "timestamp": _ts(),
-                }
-
-            # ── Wait for post to complete ──────────────────────────────────
-            page.wait_for_timeout(3000)
-            success = "compose" not in page.url
-
-            screenshot_path = f"/tmp/twitter_post_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-            page.screenshot(path=screenshot_path)
-
-            if not success:
-                return {
-                    "status":     "error",
-                    "error":      "Post may not have submitted — still on compose page.",
-                    "screenshot": screenshot_path,
-                    "timestamp":  _ts(),
-                }
+        if not posted:
+            screenshot_path = _debug_shot(page, "twitter_post_debug", stamp)
+            return {
+                "status":    "error",
+                "error":     f"Could not click Post button. Screenshot: {screenshot_path}",
+                "timestamp": ts,
+            }
 
+        # ── Wait for post to complete ──────────────────────────────────
+        # X confirms with a "Your post was sent" toast; return as soon as it
+        # shows, capped at the 3s this step used to sleep unconditionally.
+        try:
+            page.wait_for_selector("div[data-testid='toast']", timeout=3000)
+        except PlaywrightTimeout:
+            pass
+        if "compose" in page.url:
             return {
-                "status":          "posted",
-                "profile_url":     "https://x.com/home",
-                "screenshot":      screenshot_path,
-                "content_preview": content[:80] + ("..." if len(content) > 80 else ""),
-                "timestamp":       _ts(),
+                "status":     "error",
+                "error":      "Post may not have submitted — still on compose page.",
+                "screenshot": _debug_shot(page, "twitter_post", stamp),
+                "timestamp":  ts,
             }
 
-        except PlaywrightTimeout as exc:
-            return {"status": "error", "error": f"Timeout: {exc}", "timestamp": _ts()}
-        except Exception as exc:
-            return {"status": "error", "error": str(exc), "timestamp": _ts()}
+        result = {
+            "status":          "posted",
+            "profile_url":     "https://x.com/home",
+            "content_preview": _preview(content, 80),
+            "timestamp":       ts,
+        }
+        if audit == "screenshot":
+            result["screenshot"] = _debug_shot(page, "twitter_post", stamp, jpeg=True)
+        elif audit == "html":
+            html_path = f"/tmp/twitter_post_{stamp}.html"
+            Path(html_path).write_text(page.content(), encoding="utf-8")
+            result["html_snapshot"] = html_path
+        return result
+
+    except PlaywrightTimeout as exc:
+        return {"status": "error", "error": f"Timeout: {exc}", "timestamp": ts}
+    except Exception as exc:
+        return {"status": "error", "error": str(exc), "timestamp": ts}
+
+
+def create_post(
+    content: str,
+    session_path: Path,
+    headless: bool = True,
+    dry_run: bool = False,
+    audit: str = "none",
+) -> dict:
+    result = _preflight(content, dry_run)
+    if result is not None:
+        return result
+
+    if not session_path.exists():
+        return _session_missing(session_path)
+
+    sync_playwright = _require_playwright()
+    with sync_playwright() as p:
+        context, page = _launch(p, session_path, headless)
+        try:
+            return _post_on_page(page, content, audit)
         finally:
             context.close()
 
 
-def main() -> None:
+def serve(
+    session_path: Path,
+    headless: bool = True,
+    audit: str = "none",
+    dry_run: bool = False,
+) -> int:
+    """Post each JSON request read from stdin through one warm browser session.
+
+    One request per line, e.g. {"content": "...", "dry_run": false}; one JSON
+    result per line on stdout. dry_run=True makes every request a dry run,
+    whatever the request says. Saves the browser launch and profile load for
+    every post after the first. Returns the process exit code.
+    """
+    if not session_path.exists():
+        _emit(_session_missing(session_path))
+        return 1
+
+    sync_playwright = _require_playwright()
+    with sync_playwright() as p:
+        context, page = _launch(p, session_path, headless)
+        try:
+            for line in sys.stdin:
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                    content = request["content"]
+                    request_dry_run = dry_run or bool(request.get("dry_run", False))
+                    if not isinstance(content, str):
+                        raise TypeError("content must be a string")
+                except (ValueError, KeyError, TypeError) as exc:
+                    result = {"status": "error", "error": f"Bad request: {exc!r}", "timestamp": _ts()}
+                else:
+                    result = _preflight(content, request_dry_run)
+                    if result is None:
+                        # One resident tab serves every request; _post_on_page
+                        # navigates it afresh, so only a crashed tab is replaced.
+                        if page.is_closed():
+                            page = _open_page(context)
+                        result = _post_on_page(page, content, audit)
+                _emit(result)
+        finally:
+            context.close()
+    return 0
+
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Twitter/X Poster — Playwright session-based action script."
     )
@@ -242,28 +493,43 @@ def main() -> None:
     parser.add_argument("--no-headless", dest="headless", action="store_false",
                         help="Show browser window")
     parser.add_argument("--dry-run",     action="store_true", help="Preview without posting")
+    parser.add_argument("--serve",       action="store_true",
+                        help="Keep the browser open and post one JSON request per stdin line")
+    parser.add_argument("--audit-mode",  choices=("none", "screenshot", "html"), default="none",
+                        help="Artefact to keep for a successful post (composer failures always screenshot)")
+    return parser
+
+
+def main() -> None:
+    parser = _build_parser()
     args = parser.parse_args()
+    # Resolved once here; serve() checks it exists once for the whole session
+    session_path = Path(args.session_path).expanduser().resolve()
+
+    if args.serve:
+        if args.content or args.content_file:
+            parser.error("--serve reads requests from stdin; drop --content/--content-file.")
+        sys.exit(serve(session_path, args.headless, args.audit_mode, args.dry_run))
 
     content = args.content or ""
     if args.content_file:
         cf = Path(args.content_file).expanduser()
         if not cf.exists():
-            print(json.dumps({"status": "error", "error": f"content-file not found: {cf}"}))
+            _emit({"status": "error", "error": f"content-file not found: {cf}"})
             sys.exit(1)
-        content = cf.read_text(encoding="utf-8")
+        content = cf.read_bytes().decode("utf-8")
 
     if not content.strip():
         parser.error("Tweet content is empty. Provide --content or --content-file.")
 
-    session_path = Path(args.session_path).expanduser().resolve()
-
     result = create_post(
         content      = content,
         session_path = session_path,
         headless     = args.headless,
         dry_run      = args.dry_run,
+        audit        = args.audit_mode,
     )
-    print(json.dumps(result, indent=2))
+    _emit(result, indent=True)
     sys.exit(0 if result["status"] in ("posted", "dry_run") else 1)
 
 
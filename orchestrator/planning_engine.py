@@ -11,7 +11,7 @@ Responsibilities
   6. Move original item  →  vault/Done/
   7. Update  vault/Dashboard.md  with live counts + recent activity
   8. Write JSONL audit entries to  vault/Logs/YYYY-MM-DD.jsonl
-  9. Maintain dedup state in  vault/Logs/planning_state.json
+  9. Maintain dedup state in  vault/Logs/planning_state.jsonl
 
 Security rules (hard-coded, non-negotiable)
 --------------------------------------------
@@ -31,6 +31,7 @@ Usage
 """
 
 import fcntl
+import functools
 import json
 import logging
 import logging.handlers
@@ -52,6 +53,22 @@ try:
 except ImportError:
     sys.exit("Missing dependency: pyyaml\nRun: pip install pyyaml")
 
+# libyaml's C loader when PyYAML was built with it — same semantics as
+# SafeLoader, several times faster on the per-item frontmatter parse.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+try:
+    import orjson  # optional: faster JSON encoding for audit + state lines
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialise obj to JSON bytes — orjson when installed, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, default=str).encode("utf-8")
+
 # ---------------------------------------------------------------------------
 # Logging — console + rotating file (written alongside watcher logs)
 # ---------------------------------------------------------------------------
@@ -117,7 +134,7 @@ def _load_risk_config() -> tuple[frozenset, frozenset, frozenset]:
     if not _CONFIG_PATH.exists():
         return _HIGH_RISK_KEYWORDS_DEFAULT, _MEDIUM_RISK_KEYWORDS_DEFAULT, _APPROVAL_TRIGGERS_DEFAULT
     try:
-        cfg = yaml.safe_load(_CONFIG_PATH.read_text(encoding="utf-8")) or {}
+        cfg = yaml.safe_load(_CONFIG_PATH.read_bytes().decode("utf-8")) or {}
         high    = frozenset(cfg.get("high_risk", [])) or _HIGH_RISK_KEYWORDS_DEFAULT
         medium  = frozenset(cfg.get("medium_risk", [])) or _MEDIUM_RISK_KEYWORDS_DEFAULT
         triggers = frozenset(cfg.get("approval_triggers", [])) or _APPROVAL_TRIGGERS_DEFAULT
@@ -128,9 +145,30 @@ def _load_risk_config() -> tuple[frozenset, frozenset, frozenset]:
 
 _HIGH_RISK_KEYWORDS, _MEDIUM_RISK_KEYWORDS, _APPROVAL_TRIGGERS = _load_risk_config()
 
+
+def _keyword_re(words: frozenset) -> re.Pattern:
+    """One alternation matching any keyword as a whole \\w+ token."""
+    alts = "|".join(sorted(map(re.escape, map(str, words))))
+    return re.compile(rf"(?<!\w)(?:{alts})(?!\w)", re.IGNORECASE)
+
+
+# Scanning the raw text with these stops at the first hit and never builds
+# a word list or set for the item.
+_HIGH_RISK_RE   = _keyword_re(_HIGH_RISK_KEYWORDS)
+_MEDIUM_RISK_RE = _keyword_re(_MEDIUM_RISK_KEYWORDS)
+_APPROVAL_RE    = _keyword_re(_APPROVAL_TRIGGERS)
+
 # Sources that always require approval (any external communication)
 _EXTERNAL_SOURCES = {"gmail", "whatsapp", "linkedin"}
 
+# Frontmatter fields whose values are fed to the keyword classifier together
+# with the body. Addresses, paths, timestamps and trace ids never carry risk
+# words, so they are left out rather than stringified on every item.
+_CLASSIFY_FIELDS = (
+    "subject", "topic", "from", "sender", "name", "kind", "type",
+    "original_name", "source", "priority",
+)
+
 # ---------------------------------------------------------------------------
 # Prompt injection sanitizer
 # Detects common adversarial patterns in externally-supplied text (email
@@ -171,15 +209,10 @@ def _sanitize_text(text: str, source_label: str = "unknown") -> tuple[str, bool]
     return text, False
 
 
-def _word_set(text: str) -> set[str]:
-    return set(re.findall(r"\w+", text.lower()))
-
-
 def classify_risk(text: str) -> str:
-    w = _word_set(text)
-    if w & _HIGH_RISK_KEYWORDS:
+    if _HIGH_RISK_RE.search(text):
         return "high"
-    if w & _MEDIUM_RISK_KEYWORDS:
+    if _MEDIUM_RISK_RE.search(text):
         return "medium"
     return "low"
 
@@ -189,7 +222,7 @@ def needs_approval(text: str, source: str, risk: str) -> bool:
         return True
     if risk == "high":
         return True
-    if _word_set(text) & _APPROVAL_TRIGGERS:
+    if _APPROVAL_RE.search(text):
         return True
     return False
 
@@ -201,15 +234,29 @@ def needs_approval(text: str, source: str, risk: str) -> bool:
 _FM_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n?(.*)", re.DOTALL)
 
 
+def _load_fm(fm_text: str) -> dict[str, Any]:
+    try:
+        return yaml.load(fm_text, Loader=_YAML_LOADER) or {}
+    except yaml.YAMLError:
+        return {}
+
+
 def parse_md(text: str) -> tuple[dict[str, Any], str]:
     """Return (frontmatter_dict, body_text). Gracefully handles missing FM."""
-    m = _FM_RE.match(text)
+    if not text.startswith("---"):
+        return {}, text.strip()
+
+    # Common case — a bare "---\n" fence: find the closing fence with one
+    # linear scan instead of the backtracking DOTALL regex below.
+    if text.startswith("---\n"):
+        end = text.find("\n---", 4)
+        if end == -1:
+            return {}, text.strip()
+        return _load_fm(text[4:end]), text[end + 4:].strip()
+
+    m = _FM_RE.match(text)  # "--- \n", "---\r\n" and other fence variants
     if m:
-        try:
-            fm = yaml.safe_load(m.group(1)) or {}
-        except yaml.YAMLError:
-            fm = {}
-        return fm, m.group(2).strip()
+        return _load_fm(m.group(1)), m.group(2).strip()
     return {}, text.strip()
 
 
@@ -217,9 +264,13 @@ def parse_md(text: str) -> tuple[dict[str, Any], str]:
 # Utility helpers
 # ---------------------------------------------------------------------------
 
+_SAFE_ID_RE = re.compile(r"[^a-zA-Z0-9_-]")
+
+
+@functools.lru_cache(maxsize=4096)  # sources/senders repeat across a batch
 def _safe_id(text: str, max_len: int = 36) -> str:
     """Convert arbitrary text to a filesystem-safe slug."""
-    return re.sub(r"[^a-zA-Z0-9_-]", "_", str(text).strip())[:max_len].strip("_")
+    return _SAFE_ID_RE.sub("_", str(text).strip())[:max_len].strip("_")
 
 
 def _now_iso() -> str:
@@ -272,92 +323,108 @@ def action_for(source: str, fm: dict) -> str:
 # Draft generators — template-based, source-specific
 # ---------------------------------------------------------------------------
 
-def _draft_email(fm: dict, body: str) -> str:
-    name    = _sender(fm)
-    subject = _subject(fm)
-    snippet = re.sub(r"#+.*?\n", "", body)[:300].strip().replace("\n", " ")
-    return textwrap.dedent(f"""\
-        Subject: Re: {subject}
+_HEADING_RE     = re.compile(r"#+.*?\n")
+_WA_PREVIEW_RE  = re.compile(r"### Message Preview\s*\n+(.*?)(?:\n##|$)", re.DOTALL)
+_LI_MSG_RE      = re.compile(r"### Message[^#\n]*\n+(.*?)(?:\n##|$)", re.DOTALL)
 
-        Dear {name},
 
-        Thank you for your email regarding "{subject}".
+# Templates are dedented once at import; the generators only .format() them.
 
-        I have reviewed your message:
-        > {snippet}
+_EMAIL_TEMPLATE = textwrap.dedent("""\
+    Subject: Re: {subject}
 
-        I will provide a detailed response shortly.
+    Dear {name},
 
-        [TODO — personalise this draft before approving the send action.]
+    Thank you for your email regarding "{subject}".
 
-        Best regards,
-        [Your Name]
-    """)
+    I have reviewed your message:
+    > {snippet}
 
+    I will provide a detailed response shortly.
 
-def _draft_whatsapp(fm: dict, body: str) -> str:
-    name = _sender(fm)
-    preview_m = re.search(r"### Message Preview\s*\n+(.*?)(?:\n##|$)", body, re.DOTALL)
-    preview   = preview_m.group(1).strip()[:120] if preview_m else body[:120]
-    return textwrap.dedent(f"""\
-        Hi {name}! 👋
+    [TODO — personalise this draft before approving the send action.]
 
-        Thanks for your message:
-        "{preview}"
+    Best regards,
+    [Your Name]
+""")
 
-        I'll get back to you with a full response very soon.
+_WHATSAPP_TEMPLATE = textwrap.dedent("""\
+    Hi {name}! 👋
 
-        [TODO — personalise before approving the send action.]
-    """)
+    Thanks for your message:
+    "{preview}"
 
+    I'll get back to you with a full response very soon.
 
-def _draft_linkedin(fm: dict, body: str) -> str:
-    name = _sender(fm)
-    kind = fm.get("kind", "dm")
-    msg_m = re.search(r"### Message[^#\n]*\n+(.*?)(?:\n##|$)", body, re.DOTALL)
-    msg   = msg_m.group(1).strip()[:200] if msg_m else ""
+    [TODO — personalise before approving the send action.]
+""")
 
-    if kind == "connection_request":
-        return textwrap.dedent(f"""\
-            Hi {name},
+_LINKEDIN_CONNECT_TEMPLATE = textwrap.dedent("""\
+    Hi {name},
 
-            Thank you for connecting! I'm always happy to expand my professional network.
+    Thank you for connecting! I'm always happy to expand my professional network.
 
-            I'd love to learn more about what you do and explore potential collaboration.
+    I'd love to learn more about what you do and explore potential collaboration.
 
-            Looking forward to connecting!
+    Looking forward to connecting!
 
-            [TODO — personalise before approving.]
-        """)
+    [TODO — personalise before approving.]
+""")
 
-    return textwrap.dedent(f"""\
-        Hi {name},
+_LINKEDIN_DM_TEMPLATE = textwrap.dedent("""\
+    Hi {name},
 
-        Thank you for your message{f': "{msg[:80]}"' if msg else ''}.
+    Thank you for your message{quote}.
 
-        I appreciate you reaching out. I'd be happy to discuss this further —
-        could you share a bit more detail so I can give you the best response?
+    I appreciate you reaching out. I'd be happy to discuss this further —
+    could you share a bit more detail so I can give you the best response?
 
-        [TODO — personalise before approving the send action.]
+    [TODO — personalise before approving the send action.]
 
-        Best,
-        [Your Name]
-    """)
+    Best,
+    [Your Name]
+""")
 
+_FILE_TEMPLATE = textwrap.dedent("""\
+    File received: {filename}  ({size} bytes)
+
+    Review checklist:
+    1. Open and inspect the file contents
+    2. Identify required action (respond / archive / process)
+    3. Draft appropriate response if needed
+
+    [TODO — complete this section after reviewing the file.]
+""")
+
+
+def _draft_email(fm: dict, body: str) -> str:
+    subject = _subject(fm)
+    snippet = _HEADING_RE.sub("", body)[:300].strip().replace("\n", " ")
+    return _EMAIL_TEMPLATE.format(subject=subject, name=_sender(fm), snippet=snippet)
+
+
+def _draft_whatsapp(fm: dict, body: str) -> str:
+    preview_m = _WA_PREVIEW_RE.search(body)
+    preview   = preview_m.group(1).strip()[:120] if preview_m else body[:120]
+    return _WHATSAPP_TEMPLATE.format(name=_sender(fm), preview=preview)
 
-def _draft_file(fm: dict, body: str) -> str:
-    filename = fm.get("original_name", "the file")
-    size     = fm.get("size_bytes", "unknown")
-    return textwrap.dedent(f"""\
-        File received: {filename}  ({size} bytes)
 
-        Review checklist:
-        1. Open and inspect the file contents
-        2. Identify required action (respond / archive / process)
-        3. Draft appropriate response if needed
+def _draft_linkedin(fm: dict, body: str) -> str:
+    name = _sender(fm)
+    if fm.get("kind", "dm") == "connection_request":
+        return _LINKEDIN_CONNECT_TEMPLATE.format(name=name)
+
+    msg_m = _LI_MSG_RE.search(body)
+    msg   = msg_m.group(1).strip()[:200] if msg_m else ""
+    quote = f': "{msg[:80]}"' if msg else ""
+    return _LINKEDIN_DM_TEMPLATE.format(name=name, quote=quote)
 
-        [TODO — complete this section after reviewing the file.]
-    """)
+
+def _draft_file(fm: dict, body: str) -> str:
+    return _FILE_TEMPLATE.format(
+        filename = fm.get("original_name", "the file"),
+        size     = fm.get("size_bytes", "unknown"),
+    )
 
 
 _DRAFT_GENERATORS = {
@@ -373,6 +440,41 @@ def generate_draft(source: str, fm: dict, body: str) -> str:
     return gen(fm, body)
 
 
+# ---------------------------------------------------------------------------
+# Per-source dispatch — draft generator, action and external flag bound once
+# ---------------------------------------------------------------------------
+
+def _make_dispatcher(source: str):
+    """Return dispatch(fm, body, text, risk) -> (approval, draft, action).
+
+    The source's draft generator, default action and external-source flag are
+    resolved here once, so the per-item call makes no table lookups. `action`
+    is None when no approval is needed.
+    """
+    draft_fn    = _DRAFT_GENERATORS.get(source, _draft_file)
+    default_act = _ACTION_MAP.get(source, "send_message")
+    is_external = source in _EXTERNAL_SOURCES
+    by_kind     = source == "linkedin"  # only source whose action depends on fm
+
+    def dispatch(fm: dict, body: str, text: str, risk: str) -> tuple[bool, str, str | None]:
+        approval = is_external or needs_approval(text, source, risk)
+        action   = None
+        if approval:
+            action = action_for(source, fm) if by_kind else default_act
+        return approval, draft_fn(fm, body), action
+
+    return dispatch
+
+
+_SOURCE_DISPATCH = {
+    src: _make_dispatcher(src)
+    for src in ("gmail", "whatsapp", "linkedin", "file_drop")
+}
+# Unknown sources behave exactly like file_drop: _draft_file, "send_message",
+# not external.
+_DEFAULT_DISPATCH = _SOURCE_DISPATCH["file_drop"]
+
+
 # ---------------------------------------------------------------------------
 # Plan.md builder
 # ---------------------------------------------------------------------------
@@ -390,16 +492,21 @@ def build_plan(
     plan_path: Path,
     approval_path: Path | None,
     trace_id: str = "",
+    draft: str | None = None,
 ) -> str:
+    """Render PLAN_*.md. Pass `draft` to reuse one already generated for the item."""
     rel_source  = source_file.relative_to(vault_path)
     sender_disp = _sender(fm)
     subj_disp   = _subject(fm)
+    # body already has its frontmatter stripped by parse_md, so only headings
+    # need removing; cap the input so the substitution cost is bounded.
     summary     = textwrap.fill(
-        re.sub(r"#+.*?\n|---.*?---", "", body, flags=re.DOTALL)[:400]
+        _HEADING_RE.sub("", body[:2000])[:400]
         .replace("\n", " ").strip(),
         width=80,
     )
-    draft       = generate_draft(source, fm, body)
+    if draft is None:
+        draft = generate_draft(source, fm, body)
     draft_block = textwrap.indent(draft.strip(), "    ")
 
     if approval_path:
@@ -549,27 +656,76 @@ The following **{action_label}** will be executed via the appropriate MCP server
 # ---------------------------------------------------------------------------
 
 class StateStore:
+    """Dedup state kept as an append-only JSONL log of per-file deltas.
+
+    Each claim / mark / unmark appends one line instead of rewriting the whole
+    state file, and the log is replayed into a dict on startup. Once the log
+    grows past _COMPACT_RATIO × live entries it is rewritten with one line per
+    entry. A legacy planning_state.json is imported on first load.
+    """
+
+    __slots__ = ("_path", "_lines", "_data", "_lock")
+
+    _COMPACT_RATIO = 10
+    _COMPACT_MIN   = 64  # never compact a log shorter than this
+
     def __init__(self, vault_path: Path):
-        self._path = vault_path / "Logs" / "planning_state.json"
+        self._path = vault_path / "Logs" / "planning_state.jsonl"
         self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lines = 0
         self._data: dict = self._load()
         self._lock = threading.Lock()  # guards all in-memory + disk writes
 
     def _load(self) -> dict:
+        processed: dict = {}
         if self._path.exists():
             try:
-                return json.loads(self._path.read_text(encoding="utf-8"))
-            except (json.JSONDecodeError, OSError):
-                pass
-        return {"processed": {}}
-
-    def _save(self) -> None:
+                lines = self._path.read_bytes().splitlines()
+            except OSError:
+                lines = []
+            for line in lines:
+                self._lines += 1
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    continue  # torn final line from a crash
+                name = rec.pop("filename", None)
+                if name is None:
+                    continue
+                if rec.get("removed"):
+                    processed.pop(name, None)
+                else:
+                    processed[name] = rec
+            return {"processed": processed}
+
+        legacy = self._path.with_suffix(".json")
+        if legacy.exists():
+            try:
+                processed = json.loads(legacy.read_bytes().decode("utf-8"))["processed"]
+            except (ValueError, OSError, KeyError, TypeError):
+                processed = {}
+        data = {"processed": processed}
+        if processed:
+            self._data = data
+            self._compact()
+        return data
+
+    def _append(self, filename: str, record: dict) -> None:
+        with self._path.open("ab") as f:
+            f.write(_dumps({"filename": filename, **record}) + b"\n")
+        self._lines += 1
+        live = len(self._data["processed"])
+        if self._lines > max(self._COMPACT_MIN, self._COMPACT_RATIO * live):
+            self._compact()
+
+    def _compact(self) -> None:
         tmp = self._path.with_suffix(".tmp")
-        tmp.write_text(
-            json.dumps(self._data, indent=2, default=str),
-            encoding="utf-8",
-        )
+        processed = self._data["processed"]
+        with tmp.open("wb") as f:
+            for name, rec in processed.items():
+                f.write(_dumps({"filename": name, **rec}) + b"\n")
         os.replace(tmp, self._path)
+        self._lines = len(processed)
 
     def is_processed(self, filename: str) -> bool:
         with self._lock:
@@ -586,13 +742,14 @@ class StateStore:
             if filename in self._data["processed"]:
                 return False
             # Reserve the slot with a sentinel before releasing the lock
-            self._data["processed"][filename] = {
+            entry = {
                 "timestamp": timestamp,
                 "status":    "claimed",
                 "plan":      None,
                 "approval":  None,
             }
-            self._save()
+            self._data["processed"][filename] = entry
+            self._append(filename, entry)
             return True
 
     def mark_processed(
@@ -604,18 +761,19 @@ class StateStore:
         timestamp: str,
     ) -> None:
         with self._lock:
-            self._data["processed"][filename] = {
+            entry = {
                 "timestamp": timestamp,
                 "plan":      plan_path,
                 "approval":  approval_path,
             }
-            self._save()
+            self._data["processed"][filename] = entry
+            self._append(filename, entry)
 
     def unmark(self, filename: str) -> None:
         """Remove a claimed-but-failed entry so the next cycle can retry."""
         with self._lock:
-            self._data["processed"].pop(filename, None)
-            self._save()
+            if self._data["processed"].pop(filename, None) is not None:
+                self._append(filename, {"removed": True})
 
 
 # ---------------------------------------------------------------------------
@@ -623,36 +781,108 @@ class StateStore:
 # ---------------------------------------------------------------------------
 
 class AuditLog:
+    """Appends to Logs/<date>.jsonl through one unbuffered binary handle.
+
+    Each event is serialised to bytes and written with a single write(). The
+    handle stays open across events and is reopened only when the date rolls
+    over, instead of an open/append/close round-trip per event.
+    """
+
+    __slots__ = ("_log_dir", "_fh", "_today", "_lock")
+
     def __init__(self, vault_path: Path):
         self._log_dir = vault_path / "Logs"
         self._log_dir.mkdir(parents=True, exist_ok=True)
-
-    def _path(self) -> Path:
-        return self._log_dir / f"{_today_str()}.jsonl"
+        self._fh = None
+        self._today = ""
+        self._lock = threading.Lock()  # run_once writes from worker threads
 
     def write(self, event: str, **kwargs: Any) -> None:
         entry = {"timestamp": _now_iso(), "event": event, **kwargs}
-        with self._path().open("a", encoding="utf-8") as f:
-            f.write(json.dumps(entry, default=str) + "\n")
+        line  = _dumps(entry) + b"\n"
+        with self._lock:
+            today = _today_str()
+            if self._fh is None or today != self._today:
+                if self._fh is not None:
+                    self._fh.close()
+                self._fh = (self._log_dir / f"{today}.jsonl").open(
+                    "ab", buffering=0,
+                )
+                self._today = today
+            self._fh.write(line)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+
+
+# ---------------------------------------------------------------------------
+# Archive move
+# ---------------------------------------------------------------------------
+
+def _move_no_clobber(src: Path, dest: Path) -> Path:
+    """Move src to dest, or to a timestamped sibling if dest is taken.
+
+    os.link() refuses to overwrite, so the collision check and the move are a
+    single syscall instead of an exists() probe that races with rename().
+    Falls back to rename() on filesystems without hard-link support.
+    """
+    try:
+        os.link(src, dest)
+    except FileExistsError:
+        dest = dest.with_name(f"{dest.stem}_{time.time_ns()}{dest.suffix}")
+    except OSError:
+        if dest.exists():
+            dest = dest.with_name(f"{dest.stem}_{time.time_ns()}{dest.suffix}")
+    else:
+        try:
+            src.unlink()
+        except OSError:
+            dest.unlink(missing_ok=True)
+            raise
+        return dest
+    src.rename(dest)
+    return dest
 
 
 # ---------------------------------------------------------------------------
 # Dashboard updater
 # ---------------------------------------------------------------------------
 
-def update_dashboard(vault_path: Path, recent_activities: list[str]) -> None:
-    def _count(folder: str) -> int:
-        return sum(
-            1 for p in (vault_path / folder).glob("*.md")
-            if p.name != ".gitkeep"
-        )
+_DASHBOARD_FOLDERS = (
+    "Needs_Action", "Plans", "Pending_Approval", "Approved", "Rejected", "Done",
+)
+
+
+def count_vault(vault_path: Path) -> dict[str, int]:
+    """Count the *.md files in each dashboard folder — one scandir per folder."""
+    counts: dict[str, int] = {}
+    for folder in _DASHBOARD_FOLDERS:
+        with os.scandir(vault_path / folder) as it:
+            counts[folder] = sum(
+                1 for e in it
+                if e.name.endswith(".md") and not e.name.startswith(".")
+            )
+    return counts
 
-    na  = _count("Needs_Action")
-    pl  = _count("Plans")
-    pa  = _count("Pending_Approval")
-    ap  = _count("Approved")
-    rj  = _count("Rejected")
-    dn  = _count("Done")
+
+def update_dashboard(
+    vault_path: Path,
+    recent_activities: list[str],
+    counts: dict[str, int] | None = None,
+) -> None:
+    """Rewrite Dashboard.md. Pass `counts` to skip rescanning the vault."""
+    if counts is None:
+        counts = count_vault(vault_path)
+
+    na  = counts["Needs_Action"]
+    pl  = counts["Plans"]
+    pa  = counts["Pending_Approval"]
+    ap  = counts["Approved"]
+    rj  = counts["Rejected"]
+    dn  = counts["Done"]
 
     activity_block = "\n".join(
         f"- {a}" for a in recent_activities[-10:]
@@ -695,6 +925,16 @@ updated: {_now_iso()}
 class PlanningEngine:
     """Scans Needs_Action, generates Plans and Approval requests, archives originals."""
 
+    # Dashboard counts are tracked incrementally as items are processed and
+    # reconciled with a full vault rescan every this many cycles, which picks
+    # up files moved by other actors (approvals, executor, manual edits).
+    _RECOUNT_EVERY = 10
+
+    __slots__ = (
+        "vault", "log", "state", "audit",
+        "_recent", "_recent_lock", "_counts", "_counts_lock", "_cycles",
+    )
+
     def __init__(self, vault_path: Path):
         self.vault   = vault_path.resolve()
         self.log     = logging.getLogger("PlanningEngine")
@@ -710,6 +950,10 @@ class PlanningEngine:
         ):
             (self.vault / folder).mkdir(parents=True, exist_ok=True)
 
+        self._counts = count_vault(self.vault)
+        self._counts_lock = threading.Lock()
+        self._cycles = 0
+
         self.log.info(f"PlanningEngine ready — vault: {self.vault}")
 
     # ------------------------------------------------------------------
@@ -760,7 +1004,7 @@ class PlanningEngine:
         # Also acquire an exclusive flock for cross-PROCESS safety
         # (multiple separate processes can both call _process_file on the same file)
         try:
-            lock_fd = md_file.open("r", encoding="utf-8")
+            lock_fd = md_file.open("rb")
             fcntl.flock(lock_fd.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
         except BlockingIOError:
             self.log.debug(f"Skipping {filename} — locked by another process")
@@ -778,7 +1022,9 @@ class PlanningEngine:
 
             self.log.info(f"Processing: {filename}")
             try:
-                text = lock_fd.read()
+                text = lock_fd.read().decode("utf-8")  # one read, one bulk decode
+                if "\r" in text:  # what text mode's universal newlines did
+                    text = text.replace("\r\n", "\n").replace("\r", "\n")
             except OSError as exc:
                 self.log.error(f"Cannot read {filename}: {exc}")
                 self.state.unmark(filename)
@@ -796,12 +1042,16 @@ class PlanningEngine:
                     level="WARNING",
                 )
 
-            full_text = " ".join(str(v) for v in fm.values()) + " " + body
+            full_text = " ".join(
+                str(fm[k]) for k in _CLASSIFY_FIELDS if k in fm
+            ) + " " + body
 
             source     = str(fm.get("source", "file_drop")).lower()
             trace_id   = str(fm.get("trace_id", ""))
             risk       = classify_risk(full_text)
-            approval   = needs_approval(full_text, source, risk)
+            dispatch   = _SOURCE_DISPATCH.get(source, _DEFAULT_DISPATCH)
+            # Draft is rendered once — shared by the plan and the approval request
+            approval, draft, action = dispatch(fm, body, full_text, risk)
             priority   = self._priority(fm, risk)
             sender_raw = _sender(fm)
 
@@ -812,7 +1062,6 @@ class PlanningEngine:
             # ── Approval path ──────────────────────────────────────────────
             approval_path: Path | None = None
             if approval:
-                action        = action_for(source, fm)
                 appr_name     = self._approval_filename(action, sender_raw, md_file.stem)
                 approval_path = self.vault / "Pending_Approval" / appr_name
 
@@ -832,16 +1081,15 @@ class PlanningEngine:
                     plan_path       = plan_path,
                     approval_path   = approval_path,
                     trace_id        = trace_id,
+                    draft           = draft,
                 )
                 plan_path.write_text(plan_content, encoding="utf-8")
                 plan_written = True
                 self.log.info(f"  Plan      → Plans/{plan_name}")
 
                 if approval_path:
-                    draft      = generate_draft(source, fm, body)
-                    action_str = action_for(source, fm)
                     appr_content = build_approval(
-                        action     = action_str,
+                        action     = action,
                         plan_path  = plan_path,
                         vault_path = self.vault,
                         source     = source,
@@ -854,11 +1102,7 @@ class PlanningEngine:
                     approval_written = True
                     self.log.info(f"  Approval  → Pending_Approval/{approval_path.name}")
 
-                done_dest = self.vault / "Done" / filename
-                if done_dest.exists():
-                    stem, sfx = done_dest.stem, done_dest.suffix
-                    done_dest = done_dest.with_name(f"{stem}_{int(time.time())}{sfx}")
-                md_file.rename(done_dest)
+                done_dest = _move_no_clobber(md_file, self.vault / "Done" / filename)
                 self.log.info(f"  Archived  → Done/{done_dest.name}")
 
             except Exception:
@@ -902,11 +1146,21 @@ class PlanningEngine:
                     f"`{ts_short}` [{source.upper()}] {sender_raw[:35]} "
                     f"→ `{plan_name}`{appr_note}"
                 )
+            with self._counts_lock:
+                self._counts["Needs_Action"] -= 1
+                self._counts["Done"]         += 1
+                self._counts["Plans"]        += 1
+                if approval_path:
+                    self._counts["Pending_Approval"] += 1
 
         finally:
             fcntl.flock(lock_fd.fileno(), fcntl.LOCK_UN)
             lock_fd.close()
 
+    def _dashboard_counts(self) -> dict[str, int]:
+        with self._counts_lock:
+            return dict(self._counts)
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -917,18 +1171,37 @@ class PlanningEngine:
         Uses a ThreadPoolExecutor so multiple items are processed in parallel.
         File-level locking (fcntl + StateStore.claim_if_unprocessed) ensures
         each item is handled by exactly one thread even across restarts.
+        The audit log handle is held for the cycle and closed when it ends.
         """
-        pending = sorted(
-            (
-                p for p in (self.vault / "Needs_Action").glob("*.md")
-                if p.name != ".gitkeep"
-            ),
-            key=lambda p: p.stat().st_mtime,
-        )
+        try:
+            return self._run_cycle(max_workers)
+        finally:
+            self.audit.close()
+
+    def _run_cycle(self, max_workers: int) -> int:
+        self._cycles += 1
+        if self._cycles % self._RECOUNT_EVERY == 0:
+            counts = count_vault(self.vault)
+            with self._counts_lock:
+                self._counts = counts
+
+        # One scandir pass filters by name without a stat; sorting by mtime
+        # still costs one stat() per .md file (DirEntry caches it after that).
+        with os.scandir(self.vault / "Needs_Action") as it:
+            entries = sorted(
+                (
+                    e for e in it
+                    if e.name.endswith(".md") and not e.name.startswith(".")
+                ),
+                key=lambda e: e.stat().st_mtime,
+            )
+        pending = [Path(e.path) for e in entries]
+        with self._counts_lock:
+            self._counts["Needs_Action"] = len(pending)  # free from the scan above
 
         if not pending:
             self.log.info("Needs_Action is empty — nothing to process.")
-            update_dashboard(self.vault, self._recent)
+            update_dashboard(self.vault, self._recent, self._dashboard_counts())
             return 0
 
         self.log.info(
@@ -961,7 +1234,7 @@ class PlanningEngine:
 
         with self._recent_lock:
             recent_snapshot = list(self._recent)
-        update_dashboard(self.vault, recent_snapshot)
+        update_dashboard(self.vault, recent_snapshot, self._dashboard_counts())
         self.log.info(f"Cycle complete — {processed}/{len(pending)} item(s) processed.")
         return processed
 
@@ -214,6 +214,31 @@ class TestPlanningEngine:
         assert "Done" in content
         assert "Pending Approval" in content
 
+    def test_dashboard_counts_track_processed_items(self, vault):
+        """Incremental dashboard counts must match a fresh rescan of the vault."""
+        from orchestrator.planning_engine import PlanningEngine, count_vault
+
+        self._make_email_file(vault)
+        engine = PlanningEngine(vault)
+        engine.run_once()
+
+        assert engine._dashboard_counts() == count_vault(vault)
+
+    def test_audit_log_written_and_closed_after_run(self, vault):
+        """run_once must leave an item_processed audit entry and no open handle."""
+        import json
+        from orchestrator.planning_engine import PlanningEngine
+
+        self._make_email_file(vault)
+        engine = PlanningEngine(vault)
+        engine.run_once()
+
+        logs = list((vault / "Logs").glob("*-*-*.jsonl"))
+        assert logs, "No audit log written"
+        events = [json.loads(l)["event"] for l in logs[0].read_text().splitlines()]
+        assert "item_processed" in events
+        assert engine.audit._fh is None
+
 
 # ---------------------------------------------------------------------------
 # Test 3: Executor dry-run dispatch
@@ -266,6 +291,32 @@ class TestExecutorDryRun:
         ex.execute_approval(approval, vault, dry_run=True)
         assert approval.exists(), "Approval file must remain in Approved/ after dry-run"
 
+    def test_run_once_dry_run_batch(self, vault, capsys):
+        """_run_once processes every approval in a batch."""
+        import execute as ex
+        ex._load_rate_state(vault)
+        ex._load_metrics(vault)
+
+        for _ in range(3):
+            self._make_approval(vault, "send_email")
+        rc = ex._run_once(vault, vault / "Approved", dry_run=True, once_file=None)
+        assert rc == 0
+        assert "Processed: 3" in capsys.readouterr().out
+
+    def test_run_once_withdrawn_approval_is_not_dispatched(self, vault, capsys):
+        """An approval removed from Approved/ before its turn is an error, not a send."""
+        import execute as ex
+        ex._load_rate_state(vault)
+        ex._load_metrics(vault)
+
+        approval = self._make_approval(vault, "send_email")
+        approval.unlink()
+        rc = ex._run_once(vault, vault / "Approved", dry_run=False, once_file=None,
+                          files=[approval])
+        assert rc == 1
+        assert not approval.exists()
+        assert not list((vault / "Done").glob("*.md"))
+
     def test_unknown_action_returns_error(self, vault):
         """Unknown action type must return error without crashing."""
         import execute as ex
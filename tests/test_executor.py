@@ -1,5 +1,6 @@
 """Tests for approval-executor/scripts/execute.py — field parsing, routing, rate limiting."""
 import importlib
+import json
 import sys
 import pytest
 from datetime import datetime, timezone, timedelta
@@ -35,6 +36,13 @@ class TestExtractField:
         result = execute._extract_field(body, "Action")
         assert "send_email" in result
 
+    def test_uncommon_label_is_compiled_once(self):
+        body = "- **Priority:** high"
+        assert execute._extract_field(body, "Priority") == "high"
+        pattern = execute._FIELD_RES["Priority"]
+        assert execute._extract_field(body, "Priority") == "high"
+        assert execute._FIELD_RES["Priority"] is pattern
+
 
 # ---------------------------------------------------------------------------
 # _extract_message
@@ -87,6 +95,58 @@ class TestParseApproval:
         fm, body = execute._parse_approval(text)
         assert isinstance(fm, dict)
 
+    def test_quoted_values_are_unquoted(self):
+        text = "---\naction: 'send_email'\ntrace_id: \"abc-123\"\n---\n\nBody."
+        fm, _ = execute._parse_approval(text)
+        assert fm == {"action": "send_email", "trace_id": "abc-123"}
+
+    def test_iso_timestamp_value_keeps_colons(self):
+        text = "---\nexpires_at: 2030-01-01T00:00:00+00:00\n---\n\nBody."
+        fm, _ = execute._parse_approval(text)
+        assert fm["expires_at"] == "2030-01-01T00:00:00+00:00"
+
+    def test_nested_yaml_falls_back_to_full_parser(self):
+        pytest.importorskip("yaml")
+        text = "---\naction: send_email\ntags:\n  - urgent\n---\n\nBody."
+        fm, _ = execute._parse_approval(text)
+        assert fm["action"] == "send_email"
+        assert fm["tags"] == ["urgent"]
+
+    def test_inline_comment_and_null_go_through_yaml(self):
+        pytest.importorskip("yaml")
+        text = "---\naction: send_email  # outbound\nexpires_at: ~\n---\n\nBody."
+        fm, _ = execute._parse_approval(text)
+        assert fm["action"] == "send_email"
+        assert fm["expires_at"] is None
+
+    def test_without_yaml_unparseable_frontmatter_fails_closed(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "yaml", None)  # import yaml → ImportError
+        text = "---\ntags:\n  - urgent\naction: send_email\n---\n\nBody."
+        with pytest.raises(ValueError):
+            execute._parse_approval(text)
+
+    def test_without_yaml_flat_frontmatter_still_parses(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "yaml", None)
+        text = "---\naction: send_email\nstatus: approved\n---\n\nBody."
+        fm, _ = execute._parse_approval(text)
+        assert fm == {"action": "send_email", "status": "approved"}
+
+
+# ---------------------------------------------------------------------------
+# _set_status
+# ---------------------------------------------------------------------------
+
+class TestSetStatus:
+    def test_rewrites_frontmatter_status(self):
+        text = "---\naction: send_email\nstatus: approved\n---\n\nBody."
+        assert "status: sent\n" in execute._set_status(text, "sent")
+
+    def test_leaves_body_status_lines_alone(self):
+        text = "---\nstatus: approved\n---\n\n## Message / Content\n\nstatus: keep me\n"
+        updated = execute._set_status(text, "sent")
+        assert updated.startswith("---\nstatus: sent\n---")
+        assert "status: keep me" in updated
+
 
 # ---------------------------------------------------------------------------
 # _build_args
@@ -160,6 +220,25 @@ class TestRateLimit:
         assert execute._rate_limit_check() is True
 
 
+# ---------------------------------------------------------------------------
+# Cached clock
+# ---------------------------------------------------------------------------
+
+class TestCachedNow:
+    def test_uses_cached_value_when_set(self):
+        fixed = datetime(2030, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        token = execute._cached_now.set(fixed)
+        try:
+            assert execute._ts() == fixed.isoformat()
+            assert execute._today() == "2030-01-02"
+        finally:
+            execute._cached_now.reset(token)
+
+    def test_falls_back_to_live_clock(self):
+        assert execute._cached_now.get() is None
+        assert abs((execute._now() - datetime.now(timezone.utc)).total_seconds()) < 5
+
+
 # ---------------------------------------------------------------------------
 # Expiry check (via execute_approval with a temp file)
 # ---------------------------------------------------------------------------
@@ -196,3 +275,169 @@ class TestExpiryCheck:
         result = execute.execute_approval(approval_file, vault, dry_run=False)
         # Should NOT be skipped due to expiry — will fail for another reason (unknown action)
         assert result.get("reason", "") != f"Approval expired at {future}"
+
+
+# ---------------------------------------------------------------------------
+# Loop-mode wake-up
+# ---------------------------------------------------------------------------
+
+class TestWatchApproved:
+    def test_new_approval_wakes_loop(self, tmp_path):
+        pytest.importorskip("watchdog")
+        wake, observer = execute._watch_approved(tmp_path)
+        try:
+            (tmp_path / "notes.md").write_text("ignored")
+            (tmp_path / "APPROVAL_test.md").write_text("---\nstatus: approved\n---\n")
+            assert wake.wait(5)
+        finally:
+            observer.stop()
+            observer.join()
+
+
+# ---------------------------------------------------------------------------
+# Approval listing
+# ---------------------------------------------------------------------------
+
+class TestListApprovals:
+    def test_oldest_first_and_filtered(self, tmp_path):
+        import os
+        newer = tmp_path / "APPROVAL_b.md"
+        older = tmp_path / "APPROVAL_a.md"
+        newer.write_text("x")
+        older.write_text("x")
+        (tmp_path / "PLAN_c.md").write_text("x")
+        os.utime(older, (1_000_000, 1_000_000))
+        assert execute._list_approvals(tmp_path) == [older, newer]
+
+
+# ---------------------------------------------------------------------------
+# Loop-mode listing cache
+# ---------------------------------------------------------------------------
+
+class TestNewApprovals:
+    def setup_method(self):
+        execute._seen_approvals["bucket"] = None
+        execute._seen_approvals["files"] = {}
+
+    def test_leftovers_are_not_relisted(self, tmp_path):
+        f = tmp_path / "APPROVAL_a.md"
+        f.write_text("x")
+        (tmp_path / "notes.md").write_text("ignored")
+        assert execute._new_approvals(tmp_path) == [f]
+        execute._remember_leftovers([f])
+        assert execute._new_approvals(tmp_path) == []
+
+    def test_changed_leftover_is_relisted(self, tmp_path):
+        f = tmp_path / "APPROVAL_a.md"
+        f.write_text("x")
+        execute._new_approvals(tmp_path)
+        execute._remember_leftovers([f])
+        f.write_text("edited")
+        assert execute._new_approvals(tmp_path) == [f]
+
+    def test_new_hour_clears_cache(self, tmp_path):
+        f = tmp_path / "APPROVAL_a.md"
+        f.write_text("x")
+        execute._new_approvals(tmp_path)
+        execute._remember_leftovers([f])
+        execute._seen_approvals["bucket"] = "1970-01-01T00"
+        assert execute._new_approvals(tmp_path) == [f]
+
+
+# ---------------------------------------------------------------------------
+# Audit writer
+# ---------------------------------------------------------------------------
+
+class TestAuditWriter:
+    def test_entries_on_disk_after_flush(self, tmp_path):
+        execute._audit(tmp_path, "first", n=1)
+        execute._audit(tmp_path, "second", n=2)
+        execute._flush_audit()
+        log_file = tmp_path / "Logs" / f"{execute._today()}.jsonl"
+        lines = log_file.read_text().splitlines()
+        assert [json.loads(l)["event"] for l in lines] == ["first", "second"]
+
+    def test_flush_without_entries_returns(self):
+        execute._flush_audit(timeout=1)
+
+
+# ---------------------------------------------------------------------------
+# Subprocess dispatch
+# ---------------------------------------------------------------------------
+
+class TestSubprocessDispatch:
+    def setup_method(self):
+        execute._rate_state["bucket"] = None
+        execute._rate_state["count"] = 0
+
+    def test_failed_skill_output_is_parsed_and_routed(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("ODOO_URL", "http://127.0.0.1:9")  # nothing listens here
+        (tmp_path / "Approved").mkdir()
+        approval_file = tmp_path / "Approved" / "APPROVAL_ODOO_lead.md"
+        approval_file.write_text(
+            "---\ntype: approval_request\naction: odoo_create_lead\nstatus: approved\n---\n\n"
+            "- **Target:** Acme Corp\n\n## Message / Content\n\n  Interested in pricing.\n"
+        )
+
+        result = execute.execute_approval(approval_file, tmp_path, dry_run=False)
+        assert result["status"] == "error"
+        assert result["destination"] == "Failed"
+        assert result["result"]["status"] == "error"
+        failed = tmp_path / "Failed" / "APPROVAL_ODOO_lead.md"
+        assert not approval_file.exists()
+        assert "status: error" in failed.read_text()
+        assert "<!-- executed_at:" in failed.read_text()
+
+
+# ---------------------------------------------------------------------------
+# _relocate
+# ---------------------------------------------------------------------------
+
+class TestRelocate:
+    def test_stamps_source_then_moves_without_overwriting(self, tmp_path):
+        (tmp_path / "Done").mkdir()
+        (tmp_path / "Done" / "APPROVAL_x.md").write_text("older")
+        src = tmp_path / "APPROVAL_x.md"
+        src.write_text("status: approved")
+        dest = execute._relocate(src, tmp_path / "Done", "status: sent")
+        assert dest.name.startswith("APPROVAL_x_")
+        assert dest.read_text() == "status: sent"
+        assert (tmp_path / "Done" / "APPROVAL_x.md").read_text() == "older"
+        assert not src.exists()
+
+    def test_failed_unlink_leaves_no_copy_in_dest(self, tmp_path, monkeypatch):
+        (tmp_path / "Done").mkdir()
+        src = tmp_path / "APPROVAL_u.md"
+        src.write_text("status: approved")
+        real_unlink = Path.unlink
+
+        def _unlink(self, missing_ok=False):
+            if self == src:
+                raise PermissionError("busy")
+            return real_unlink(self, missing_ok=missing_ok)
+
+        monkeypatch.setattr(Path, "unlink", _unlink)
+        with pytest.raises(PermissionError):
+            execute._relocate(src, tmp_path / "Done", "status: sent")
+        assert src.read_text() == "status: sent"
+        assert not list((tmp_path / "Done").iterdir())
+
+    def test_timeout_status_is_not_executed_again(self, tmp_path):
+        approval_file = tmp_path / "APPROVAL_t.md"
+        approval_file.write_text("---\naction: send_email\nstatus: timeout\n---\n\nBody.")
+        result = execute.execute_approval(approval_file, tmp_path, dry_run=False)
+        assert result["status"] == "skipped"
+
+    def test_move_failure_is_a_move_error_not_action_error(self, tmp_path, monkeypatch):
+        events = []
+        monkeypatch.setattr(execute, "_audit", lambda vault, event, **kw: events.append(event))
+
+        def _boom(*args):
+            raise PermissionError("read-only")
+
+        monkeypatch.setattr(execute, "_relocate", _boom)
+        dest = execute._relocate_or_report(
+            tmp_path, tmp_path / "APPROVAL_m.md", tmp_path / "Done", "", "send_email", "",
+        )
+        assert dest is None
+        assert events == ["move_error"]
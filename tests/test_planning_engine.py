@@ -1,4 +1,6 @@
 """Tests for orchestrator/planning_engine.py — classification, parsing, helpers."""
+import json
+
 import pytest
 from orchestrator.planning_engine import (
     classify_risk,
@@ -8,6 +10,11 @@ from orchestrator.planning_engine import (
     _safe_id,
     _sender,
     _subject,
+    StateStore,
+    _move_no_clobber,
+    _SOURCE_DISPATCH,
+    _DEFAULT_DISPATCH,
+    action_for,
 )
 
 
@@ -45,6 +52,11 @@ class TestClassifyRisk:
         # Text with both high and medium keywords → high
         assert classify_risk("urgent legal dispute about invoice") == "high"
 
+    def test_keyword_must_be_whole_token(self):
+        # A keyword only counts as a whole \w+ token, in any letter case
+        assert classify_risk("hack_attempt and hacker news") == "low"
+        assert classify_risk("LAWSUIT filed.") == "high"
+
 
 # ---------------------------------------------------------------------------
 # needs_approval
@@ -103,6 +115,18 @@ class TestParseMd:
         assert fm == {}
         assert "Just body." in body
 
+    def test_crlf_fence_falls_back_to_regex(self):
+        text = "---\r\ntype: email\r\n---\r\nBody."
+        fm, body = parse_md(text)
+        assert fm["type"] == "email"
+        assert body == "Body."
+
+    def test_unclosed_frontmatter_is_body(self):
+        text = "---\ntype: email\nno closing fence"
+        fm, body = parse_md(text)
+        assert fm == {}
+        assert body == text
+
 
 # ---------------------------------------------------------------------------
 # _safe_id
@@ -205,3 +229,96 @@ class TestGenerateDraft:
         draft = generate_draft("unknown_source", {}, "")
         assert isinstance(draft, str)
         assert len(draft) > 0
+
+
+# ---------------------------------------------------------------------------
+# StateStore
+# ---------------------------------------------------------------------------
+
+class TestStateStore:
+    def test_state_survives_restart(self, tmp_path):
+        store = StateStore(tmp_path)
+        assert store.claim_if_unprocessed("a.md", "t1") is True
+        store.mark_processed("a.md", plan_path="Plans/a", approval_path=None, timestamp="t1")
+        store.claim_if_unprocessed("b.md", "t2")
+        store.unmark("b.md")
+
+        reloaded = StateStore(tmp_path)
+        assert reloaded.is_processed("a.md")
+        assert not reloaded.is_processed("b.md")
+
+    def test_updates_append_one_line_each(self, tmp_path):
+        store = StateStore(tmp_path)
+        store.claim_if_unprocessed("a.md", "t1")
+        store.mark_processed("a.md", plan_path="Plans/a", approval_path=None, timestamp="t1")
+        lines = (tmp_path / "Logs" / "planning_state.jsonl").read_text().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[-1])["plan"] == "Plans/a"
+
+    def test_log_is_compacted(self, tmp_path):
+        store = StateStore(tmp_path)
+        for _ in range(StateStore._COMPACT_MIN):
+            store.claim_if_unprocessed("a.md", "t")
+            store.unmark("a.md")
+        lines = (tmp_path / "Logs" / "planning_state.jsonl").read_text().splitlines()
+        assert len(lines) < 2 * StateStore._COMPACT_MIN  # uncompacted would be exactly 2×
+
+    def test_imports_legacy_json_state(self, tmp_path):
+        logs = tmp_path / "Logs"
+        logs.mkdir()
+        (logs / "planning_state.json").write_text(
+            json.dumps({"processed": {"old.md": {"timestamp": "t", "plan": "p", "approval": None}}})
+        )
+        assert StateStore(tmp_path).is_processed("old.md")
+        assert (logs / "planning_state.jsonl").exists()
+
+
+# ---------------------------------------------------------------------------
+# _move_no_clobber
+# ---------------------------------------------------------------------------
+
+class TestMoveNoClobber:
+    def test_moves_to_free_name(self, tmp_path):
+        src = tmp_path / "a.md"
+        src.write_text("new")
+        dest = _move_no_clobber(src, tmp_path / "done.md")
+        assert dest == tmp_path / "done.md"
+        assert not src.exists()
+        assert dest.read_text() == "new"
+
+    def test_never_overwrites_existing(self, tmp_path):
+        (tmp_path / "done.md").write_text("old")
+        src = tmp_path / "a.md"
+        src.write_text("new")
+        dest = _move_no_clobber(src, tmp_path / "done.md")
+        assert dest != tmp_path / "done.md"
+        assert dest.name.startswith("done_") and dest.suffix == ".md"
+        assert (tmp_path / "done.md").read_text() == "old"
+        assert dest.read_text() == "new"
+        assert not src.exists()
+
+
+# ---------------------------------------------------------------------------
+# Per-source dispatch
+# ---------------------------------------------------------------------------
+
+class TestSourceDispatch:
+    @pytest.mark.parametrize("source,fm", [
+        ("gmail",     {"from": "Alice", "subject": "Hi"}),
+        ("whatsapp",  {"name": "Bob"}),
+        ("linkedin",  {"from": "Carol", "kind": "connection_request"}),
+        ("linkedin",  {"from": "Carol", "kind": "dm"}),
+        ("file_drop", {"original_name": "invoice.pdf"}),
+    ])
+    def test_matches_unbundled_helpers(self, source, fm):
+        text = "please pay the invoice"
+        risk = classify_risk(text)
+        approval, draft, action = _SOURCE_DISPATCH[source](fm, "body", text, risk)
+        assert approval is needs_approval(text, source, risk)
+        assert draft == generate_draft(source, fm, "body")
+        assert action == action_for(source, fm)
+
+    def test_no_action_without_approval(self):
+        approval, _, action = _DEFAULT_DISPATCH({}, "", "routine upload", "low")
+        assert approval is False
+        assert action is None
@@ -173,6 +173,22 @@ class TestTwitterPosterDryRun(unittest.TestCase):
         self.assertNotIn("tweet_id", out.get("result", {}),
                          "Dry-run should not return a real tweet_id")
 
+    def test_dry_run_skips_playwright(self):
+        """Playwright is imported lazily, so a dry run works without it."""
+        out = _run_skill(
+            self._script,
+            ["--content", "No browser needed", "--dry-run"],
+        )
+        self.assertEqual(out.get("status"), "dry_run", f"Unexpected output: {out}")
+
+    def test_serve_rejects_content_flag(self):
+        """--serve takes its posts from stdin, not --content."""
+        out = _run_skill(
+            self._script,
+            ["--serve", "--content", "Ignored by serve", "--dry-run"],
+        )
+        self.assertEqual(out.get("returncode"), 2, f"Unexpected output: {out}")
+
 
 # ---------------------------------------------------------------------------
 # Facebook poster — create_post --dry-run